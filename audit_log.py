@@ -0,0 +1,132 @@
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+_FLUSH = object()
+_STOP = object()
+
+
+class AuditLogger:
+    def __init__(self, filename="event_log.jsonl", batch_size=256, flush_interval=1.0,
+                 max_bytes=10 * 1024 * 1024, backups=5, queue_size=65536):
+        """
+        ثبت‌کننده‌ی رویدادهای سیستم با نوشتن دسته‌ای در یک نخ پس‌زمینه (فرمت JSON lines)
+        :param filename: مسیر فایل گزارش
+        :param batch_size: تعداد رکوردها پیش از نوشتن دسته
+        :param flush_interval: حداکثر تأخیر نوشتن (ثانیه)
+        :param max_bytes: اندازه‌ی فایل پیش از چرخش
+        :param backups: تعداد فایل‌های قدیمی نگه‌داشته‌شده
+        """
+        self.filename = filename
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-log", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def log(self, action, event=None, **payload):
+        """ثبت یک رکورد؛ فقط زمان خام گرفته می‌شود و قالب‌بندی در نخ نویسنده انجام می‌شود"""
+        if self._thread is None:
+            self._start()
+        self._queue.put((time.time(), action, event, payload))
+
+    def flush(self):
+        """نوشتن هم‌زمان همه‌ی رکوردهای صف روی دیسک"""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        done.wait()
+
+    def close(self):
+        """نوشتن رکوردهای باقی‌مانده و توقف نخ نویسنده"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is None or not thread.is_alive():
+            return
+        self._queue.put((_STOP, None))
+        thread.join()
+
+    def _run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = None
+            if item is not None and item[0] is _FLUSH:
+                self._write(batch)
+                batch = []
+                item[1].set()
+            elif item is not None and item[0] is _STOP:
+                self._write(batch)
+                return
+            elif item is not None:
+                batch.append(item)
+            if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                self._write(batch)
+                batch = []
+                deadline = time.monotonic() + self.flush_interval
+
+    def _write(self, batch):
+        """
+        نوشتن یک دسته روی دیسک
+        خطای یک رکورد یا خطای دیسک فقط گزارش می‌شود؛ اگر نخ نویسنده بمیرد log() پس از پر شدن صف قفل می‌شود.
+        """
+        if not batch:
+            return
+        lines = []
+        for timestamp, action, event, payload in batch:
+            record = {"ts": datetime.fromtimestamp(timestamp).isoformat(), "action": action}
+            if event is not None:
+                record["event"] = event
+            if payload:
+                record["payload"] = payload
+            try:
+                lines.append(json.dumps(record, ensure_ascii=False, default=str))
+            except (TypeError, ValueError) as error:
+                print(f"audit log: dropped '{action}' record: {error}", file=sys.stderr)
+        if not lines:
+            return
+        try:
+            with open(self.filename, "a", encoding="utf-8") as file:
+                file.write("\n".join(lines) + "\n")
+                size = file.tell()
+            if size >= self.max_bytes:
+                self._rotate()
+        except OSError as error:
+            print(f"audit log: could not write {len(lines)} records to {self.filename}: {error}", file=sys.stderr)
+
+    def _rotate(self):
+        """چرخش فایل‌ها: event_log.jsonl -> event_log.jsonl.1 -> ..."""
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.filename}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filename}.{index + 1}")
+        if self.backups > 0:
+            os.replace(self.filename, f"{self.filename}.1")
+        else:
+            os.remove(self.filename)
+
+
+def read_log(filename="event_log.jsonl"):
+    """پیمایش رکوردهای یک فایل گزارش"""
+    with open(filename, "r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,65 @@
+"""Compare memory and throughput of the slotted Event model with the previous class."""
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event import Event
+
+
+class LegacyEvent:
+    """The pre-__slots__ Event: per-instance __dict__, list participants, string dates."""
+
+    def __init__(self, name, date, priority, instructor=None):
+        self.name = name
+        self.date = date
+        self.priority = priority
+        self.instructor = instructor
+        self.participants = []
+        self.state = "Not Started"
+        self.rating = None
+
+    def add_participant(self, participant):
+        if participant not in self.participants:
+            self.participants.append(participant)
+
+
+def _workload(n):
+    instructors = [f"instructor-{i}" for i in range(100)]
+    return [(f"event-{i}", f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}", i % 10,
+             # Fresh string objects, as they would arrive from input() or a file.
+             "".join(instructors[i % 100])) for i in range(n)]
+
+
+def _measure(cls, rows, participants_per_event):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    events = [cls(name, date, priority, instructor=instructor) for name, date, priority, instructor in rows]
+    build = time.perf_counter() - start
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for event in events[:10000]:
+        for p in range(participants_per_event):
+            event.add_participant(f"participant-{p}")
+    register = time.perf_counter() - start
+    registrations = min(len(events), 10000) * participants_per_event
+    return current, len(rows) / build, registrations / register
+
+
+def main(n=10 ** 6, participants_per_event=200):
+    rows = _workload(n)
+    print(f"{n:,} events, {participants_per_event} participants on the first 10,000")
+    print(f"{'model':>8} {'memory MB':>10} {'bytes/event':>12} {'builds/s':>12} {'registrations/s':>16}")
+    for label, cls in (("legacy", LegacyEvent), ("slots", Event)):
+        memory, builds, registrations = _measure(cls, rows, participants_per_event)
+        print(f"{label:>8} {memory / 2 ** 20:>10.1f} {memory / n:>12.0f} {builds:>12,.0f} {registrations:>16,.0f}")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
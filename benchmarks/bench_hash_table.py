@@ -0,0 +1,64 @@
+"""Benchmark HashTable insert/get/delete against the built-in dict."""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hash_table import HashTable
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench(n):
+    keys = [f"event-{i}" for i in range(n)]
+    table = HashTable()
+    native = {}
+
+    def table_insert():
+        for i, key in enumerate(keys):
+            table.insert(key, i)
+
+    def table_get():
+        for key in keys:
+            table.get(key)
+
+    def table_delete():
+        for key in keys:
+            table.delete(key)
+
+    def dict_insert():
+        for i, key in enumerate(keys):
+            native[key] = i
+
+    def dict_get():
+        for key in keys:
+            native.get(key)
+
+    def dict_delete():
+        for key in keys:
+            del native[key]
+
+    rows = []
+    for op, ours, theirs in (("insert", table_insert, dict_insert),
+                             ("get", table_get, dict_get),
+                             ("delete", table_delete, dict_delete)):
+        t_ours = _time(ours)
+        t_dict = _time(theirs)
+        rows.append((n, op, n / t_ours, n / t_dict, t_ours / t_dict))
+    return rows
+
+
+def main(sizes=(10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)):
+    print(f"{'n':>9} {'op':>7} {'HashTable ops/s':>16} {'dict ops/s':>14} {'slowdown':>9}")
+    for n in sizes:
+        for n_, op, ours, theirs, ratio in bench(n):
+            print(f"{n_:>9} {op:>7} {ours:>16,.0f} {theirs:>14,.0f} {ratio:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6))
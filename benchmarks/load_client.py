@@ -0,0 +1,174 @@
+"""Load generator for the EventFlow JSON server.
+
+Usage:
+    python main.py serve --port 8765 &
+    python benchmarks/load_client.py --port 8765 --clients 32 --requests 2000 --writes 0.2
+    python benchmarks/load_client.py --spawn          # start an in-process server on a temp directory
+
+Each client keeps one connection open and sends requests back to back, mixing
+reads (event lookups, date and schedule queries, the next event) with writes
+(new events, registrations, instructor ratings). Prints throughput and
+p50/p99 latency per operation kind.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAYS = 365
+FIRST_DAY = date(2026, 1, 1)
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.next_id = 0
+
+    @classmethod
+    async def open(cls, host, port, path=None):
+        if path:
+            reader, writer = await asyncio.open_unix_connection(path, limit=1 << 20)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def call(self, op, **args):
+        self.next_id += 1
+        self.writer.write(json.dumps({"id": self.next_id, "op": op, "args": args}).encode("utf-8") + b"\n")
+        await self.writer.drain()
+        return json.loads(await self.reader.readline())
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def _date(rng):
+    return (FIRST_DAY + timedelta(days=rng.randrange(DAYS))).isoformat()
+
+
+async def seed(connection, events, rng):
+    """Create the initial event set the traffic runs against."""
+    for i in range(events):
+        await connection.call("add_event", name=f"seed-{i}", date=_date(rng), priority=rng.randrange(100),
+                              instructor=f"instructor-{rng.randrange(50)}")
+
+
+async def client(index, args, latencies, errors):
+    rng = random.Random(args.seed + index)
+    connection = await Connection.open(args.host, args.port, args.socket)
+    try:
+        for i in range(args.requests):
+            if rng.random() < args.writes:
+                kind = rng.choice(("add_event", "add_participant", "rate_instructor"))
+                if kind == "add_event":
+                    request = dict(name=f"client{index}-{i}", date=_date(rng), priority=rng.randrange(100),
+                                   instructor=f"instructor-{rng.randrange(50)}")
+                elif kind == "add_participant":
+                    request = dict(name=f"seed-{rng.randrange(args.events)}",
+                                   participant=f"participant-{rng.randrange(args.events * 4)}")
+                else:
+                    request = dict(instructor=f"instructor-{rng.randrange(50)}", rating=rng.randint(1, 5))
+            else:
+                kind = rng.choice(("get_event", "by_date", "schedule", "ready_event", "top_instructors"))
+                if kind == "get_event":
+                    request = dict(name=f"seed-{rng.randrange(args.events)}")
+                elif kind == "by_date":
+                    request = dict(date=_date(rng))
+                elif kind == "schedule":
+                    request = dict(participant=f"participant-{rng.randrange(args.events * 4)}")
+                elif kind == "top_instructors":
+                    request = dict(k=10)
+                else:
+                    request = {}
+            start = time.perf_counter()
+            response = await connection.call(kind, **request)
+            latencies.setdefault(kind, []).append(time.perf_counter() - start)
+            if not response["ok"] and kind != "add_participant":  # duplicate registrations are expected
+                errors.append((kind, response["error"]))
+    finally:
+        await connection.close()
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+async def run(args):
+    if not args.spawn:
+        return await drive(args)
+    from journal import Journal
+    from server import EventServer
+    with tempfile.TemporaryDirectory(prefix="eventflow-load-") as directory:
+        journal = Journal(directory)
+        server = EventServer(journal.load(), workers=args.workers)
+        ready = asyncio.Event()
+        args.socket = os.path.join(directory, "server.sock")
+        server_task = asyncio.ensure_future(server.serve(path=args.socket, ready=ready))
+        await ready.wait()
+        try:
+            return await drive(args)
+        finally:
+            server_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await server_task
+            server.close()
+            journal.close()
+
+
+async def drive(args):
+    rng = random.Random(args.seed)
+    connection = await Connection.open(args.host, args.port, args.socket)
+    await seed(connection, args.events, rng)
+    await connection.close()
+
+    latencies = {}
+    errors = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(index, args, latencies, errors) for index in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(values) for values in latencies.values())
+    everything = [value for values in latencies.values() for value in values]
+    print(f"{args.clients} clients x {args.requests} requests, {args.writes:.0%} writes")
+    print(f"throughput: {total / elapsed:,.0f} req/s over {elapsed:.2f}s")
+    print(f"{'operation':<18} {'count':>8} {'p50 ms':>9} {'p99 ms':>9}")
+    for kind in sorted(latencies):
+        values = latencies[kind]
+        print(f"{kind:<18} {len(values):>8} {percentile(values, 0.5) * 1000:>9.2f} "
+              f"{percentile(values, 0.99) * 1000:>9.2f}")
+    print(f"{'all':<18} {total:>8} {percentile(everything, 0.5) * 1000:>9.2f} "
+          f"{percentile(everything, 0.99) * 1000:>9.2f}")
+    for kind, message in errors[:10]:
+        print(f"error in {kind}: {message}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="connect to a Unix socket instead of TCP")
+    parser.add_argument("--spawn", action="store_true", help="run an in-process server on a temporary directory")
+    parser.add_argument("--workers", type=int, default=8, help="server worker threads (with --spawn)")
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=1000, help="requests per client")
+    parser.add_argument("--writes", type=float, default=0.2, help="fraction of requests that mutate state")
+    parser.add_argument("--events", type=int, default=1000, help="events created before the run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+"""Reproducible benchmark suite for EventFlow data structures and menu operations.
+
+Usage:
+    python benchmarks/run.py                       # 10^3 .. 10^6 events
+    python benchmarks/run.py --sizes 1000 10000    # selected sizes
+    python benchmarks/run.py --compare results/baseline.json
+
+Every run writes a JSON file with ops/sec and peak traced memory per
+benchmark, so runs can be compared to catch regressions.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from event import Event
+from heap import MinHeap
+from hash_table import HashTable
+from tree import EventTree
+from graph import DirectedGraph
+from store import EventStore
+from journal import Journal
+
+DEFAULT_SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+FIRST_DAY = Event("_", "2026-01-01", 0).ordinal
+
+
+def generate(n, seed=42):
+    """Synthetic workload: ~4 events per day, 1000 instructors, a sparse dependency DAG."""
+    rng = random.Random(seed)
+    days = max(365, n // 4)
+    events = []
+    dependencies = []
+    for i in range(n):
+        event = Event(f"event-{i}", FIRST_DAY + rng.randrange(days), rng.randrange(100),
+                      instructor=f"instructor-{rng.randrange(1000)}")
+        for p in range(rng.randrange(6)):
+            event.add_participant(f"participant-{rng.randrange(n * 2)}")
+        events.append(event)
+        if i and rng.random() < 0.3:
+            dependencies.append((event.name, f"event-{rng.randrange(i)}"))
+    return events, dependencies
+
+
+def _heap_insert(events, dependencies):
+    def run():
+        heap = MinHeap()
+        for event in events:
+            heap.insert(event)
+    return run, len(events)
+
+
+def _heap_extract(events, dependencies):
+    heap = MinHeap.heapify(events)
+
+    def run():
+        while heap.extract_min() is not None:
+            pass
+    return run, len(events)
+
+
+def _hash_insert(events, dependencies):
+    def run():
+        table = HashTable()
+        for event in events:
+            table.insert(event.name, event)
+    return run, len(events)
+
+
+def _hash_get(events, dependencies):
+    table = HashTable()
+    for event in events:
+        table.insert(event.name, event)
+    names = [event.name for event in events]
+
+    def run():
+        for name in names:
+            table.get(name)
+    return run, len(events)
+
+
+def _tree_insert(events, dependencies):
+    def run():
+        tree = EventTree()
+        for event in events:
+            tree.insert(event)
+    return run, len(events)
+
+
+def _tree_inorder(events, dependencies):
+    tree = EventTree()
+    tree.bulk_load(events)
+
+    def run():
+        tree.inorder_by_date()
+        tree.inorder_by_participants()
+        tree.inorder_by_instructor()
+    return run, 3 * len(events)
+
+
+def _graph_has_cycle(events, dependencies):
+    graph = DirectedGraph()
+    graph.bulk_load([event.name for event in events], dependencies)
+
+    def run():
+        graph.has_cycle()
+    return run, len(events) + len(dependencies)
+
+
+def _overlap_check(events, dependencies):
+    store = EventStore.from_events(events, dependencies)
+
+    def run():
+        store.overlaps.conflicts()
+    return run, len(events)
+
+
+def _status_view(events, dependencies):
+    store = EventStore.from_events(events, dependencies)
+
+    def run():
+        for status in ("Not Started", "Ongoing", "Completed"):
+            store.by_state(status)
+    return run, len(events)
+
+
+def _execute_next(events, dependencies):
+    # Executing mutates event state, so every run works on fresh copies.
+    store = EventStore.from_events([Event.from_dict(event.to_dict()) for event in events], dependencies)
+
+    def run():
+        while True:
+            event = store.scheduler.peek()
+            if event is None:
+                return
+            store.update_state(event.name, "Ongoing")
+            store.update_state(event.name, "Completed")
+    return run, len(events)
+
+
+_scratch = []  # temporary directories of the current run, removed by measure()
+
+
+def _scratch_directory():
+    directory = tempfile.TemporaryDirectory(prefix="eventflow-bench-")
+    _scratch.append(directory)
+    return directory.name
+
+
+def _cleanup():
+    while _scratch:
+        _scratch.pop().cleanup()
+
+
+def _save(events, dependencies):
+    store = EventStore.from_events(events, dependencies)
+    directory = _scratch_directory()
+    journal = Journal(directory)
+
+    def run():
+        journal.snapshot(store)
+    return run, len(events)
+
+
+def _load(events, dependencies):
+    directory = _scratch_directory()
+    Journal(directory).snapshot(EventStore.from_events(events, dependencies))
+
+    def run():
+        Journal(directory).load()
+    return run, len(events)
+
+
+BENCHMARKS = {
+    "heap.insert": _heap_insert,
+    "heap.extract_min": _heap_extract,
+    "hash_table.insert": _hash_insert,
+    "hash_table.get": _hash_get,
+    "tree.insert": _tree_insert,
+    "tree.inorder": _tree_inorder,
+    "graph.has_cycle": _graph_has_cycle,
+    "menu.overlap_check": _overlap_check,
+    "menu.status_view": _status_view,
+    "menu.execute_next": _execute_next,
+    "menu.save": _save,
+    "menu.load": _load,
+}
+
+
+def measure(name, n, events, dependencies, memory=True, repeat=3):
+    """Time one benchmark (best of `repeat` fresh runs), then rerun it under tracemalloc for peak memory."""
+    seconds = float("inf")
+    for _ in range(repeat):
+        run, ops = BENCHMARKS[name](events, dependencies)
+        try:
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            seconds = min(seconds, time.perf_counter() - start)
+        finally:
+            _cleanup()
+    result = {"benchmark": name, "n": n, "ops": ops, "seconds": seconds,
+              "ops_per_sec": ops / seconds if seconds else float("inf")}
+    if memory:
+        run, _ = BENCHMARKS[name](events, dependencies)
+        try:
+            gc.collect()
+            tracemalloc.start()
+            run()
+            result["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+            _cleanup()
+    return result
+
+
+def compare(results, baseline_path, threshold):
+    """Print ops/sec changes against a previous run; return the regressions."""
+    with open(baseline_path, "r", encoding="utf-8") as file:
+        baseline = {(row["benchmark"], row["n"]): row for row in json.load(file)["results"]}
+    regressions = []
+    print(f"\n{'benchmark':<22} {'n':>9} {'baseline ops/s':>15} {'ops/s':>13} {'change':>8}")
+    for row in results:
+        old = baseline.get((row["benchmark"], row["n"]))
+        if old is None:
+            continue
+        change = row["ops_per_sec"] / old["ops_per_sec"] - 1
+        flag = " <-- regression" if change < -threshold else ""
+        print(f"{row['benchmark']:<22} {row['n']:>9} {old['ops_per_sec']:>15,.0f} "
+              f"{row['ops_per_sec']:>13,.0f} {change:>+7.1%}{flag}")
+        if flag:
+            regressions.append(row)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), help="run a subset of benchmarks")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per benchmark; the best is kept")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown treated as a regression")
+    args = parser.parse_args(argv)
+
+    names = args.only or list(BENCHMARKS)
+    results = []
+    print(f"{'benchmark':<22} {'n':>9} {'ops/s':>13} {'seconds':>9} {'peak MB':>9}")
+    for n in args.sizes:
+        events, dependencies = generate(n, args.seed)
+        for name in names:
+            row = measure(name, n, events, dependencies, memory=not args.no_memory, repeat=args.repeat)
+            results.append(row)
+            peak = f"{row['peak_bytes'] / 2 ** 20:>9.1f}" if "peak_bytes" in row else f"{'-':>9}"
+            print(f"{name:<22} {n:>9} {row['ops_per_sec']:>13,.0f} {row['seconds']:>9.3f} {peak}")
+
+    output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), "results",
+                                         time.strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump({"python": platform.python_version(), "platform": platform.platform(),
+                   "seed": args.seed, "repeat": args.repeat, "results": results}, file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import islice
+
+from event import Event, VALID_STATES, to_ordinal, to_priority
+from store import EventStore
+from journal import Journal
+
+FIELDS = ("name", "date", "priority", "instructor", "state", "rating", "participants", "depends_on")
+
+
+def _format_of(path, fmt=None):
+    if fmt:
+        return fmt
+    return "jsonl" if os.path.splitext(path)[1].lower() in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def _split(value, field):
+    """فهرست‌ها در CSV با ; جدا می‌شوند و در JSONL آرایه‌ای از رشته‌ها هستند"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(";") if item.strip()]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"{field} must be a list of strings")
+    return value
+
+
+def _csv_rows(file):
+    reader = csv.DictReader(file)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _jsonl_rows(file):
+    # تجزیه‌ی JSON به parse_row سپرده می‌شود تا یک سطر خراب فقط همان سطر را رد کند
+    for line, text in enumerate(file, 1):
+        if text.strip():
+            yield line, text
+
+
+def read_rows(path, fmt=None, chunk_size=10000):
+    """
+    خواندن جریانی فایل CSV/JSONL به صورت تکه‌های chunk_size سطری
+    هر عضو تکه (شماره‌ی سطر در فایل، سطر) است؛ سطر CSV دیکشنری و سطر JSONL متن خام است.
+    """
+    fmt = _format_of(path, fmt)
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        rows = _csv_rows(file) if fmt == "csv" else _jsonl_rows(file)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+def parse_row(row):
+    """
+    تبدیل یک سطر به رویداد و وابستگی‌هایش
+    تاریخ‌ها با to_ordinal تبدیل می‌شوند که نتیجه‌ی هر تاریخ را کش می‌کند.
+    :param row: دیکشنری یا متن JSON یک سطر
+    :raises ValueError: در صورت نامعتبر بودن سطر
+    """
+    if isinstance(row, str):
+        row = json.loads(row)
+    if not isinstance(row, dict):
+        raise ValueError("row must be a JSON object")
+    name = row.get("name")
+    if not name:
+        raise ValueError("missing event name")
+    if not isinstance(name, str):
+        raise ValueError("name must be a string")
+    date = row.get("date")
+    if not isinstance(date, str):
+        raise ValueError("date must be a YYYY-MM-DD string")
+    instructor = row.get("instructor")
+    if instructor in (None, ""):
+        instructor = None
+    elif not isinstance(instructor, str):
+        raise ValueError("instructor must be a string")
+    event = Event(name, to_ordinal(date), to_priority(row.get("priority")), instructor=instructor)
+    state = row.get("state")
+    if state:
+        if state not in VALID_STATES:
+            raise ValueError(f"invalid state '{state}'")
+        event.update_state(state)
+    rating = row.get("rating")
+    if rating not in (None, ""):
+        if isinstance(rating, str):
+            rating = int(rating)
+        if isinstance(rating, bool) or not isinstance(rating, int) or not 1 <= rating <= 5:
+            raise ValueError("rating must be an integer between 1 and 5")
+        event.rating = rating
+    participants = _split(row.get("participants"), "participants")
+    if participants:
+        event.participants = dict.fromkeys(participants)
+    return event, [(name, prerequisite) for prerequisite in _split(row.get("depends_on"), "depends_on")]
+
+
+def import_files(store, paths, fmt=None, chunk_size=10000, errors=None):
+    """
+    وارد کردن رویدادها از چند فایل و ساخت یک‌جای همه‌ی ساختارها
+    :param errors: لیستی برای جمع‌آوری خطاها به صورت (مسیر، شماره‌ی سطر، پیام)
+    :return: (مخزن جدید، تعداد رویدادهای واردشده، وابستگی‌های ردشده)
+    """
+    events = list(store)
+    dependencies = list(store.dependencies())
+    seen = {event.name for event in events}
+    imported = 0
+    for path in paths:
+        for chunk in read_rows(path, fmt, chunk_size):
+            for line, row in chunk:
+                try:
+                    event, edges = parse_row(row)
+                except (ValueError, TypeError) as error:
+                    if errors is not None:
+                        errors.append((path, line, str(error)))
+                    continue
+                if event.name in seen:
+                    if errors is not None:
+                        errors.append((path, line, f"duplicate event '{event.name}'"))
+                    continue
+                seen.add(event.name)
+                events.append(event)
+                dependencies.extend(edges)
+                imported += 1
+    unknown = [pair for pair in dependencies if pair[1] not in seen]
+    if errors is not None:
+        for dependent, prerequisite in unknown:
+            errors.append(("dependencies", 0, f"'{dependent}' depends on unknown event '{prerequisite}'"))
+    dependencies = [pair for pair in dependencies if pair[1] in seen]
+    rebuilt = EventStore.from_events(events, dependencies)
+    rejected = [pair for pair in dependencies if pair[1] not in rebuilt.graph.graph[pair[0]]]
+    rebuilt.instructor_ratings = store.instructor_ratings
+    rebuilt.journal = store.journal
+    return rebuilt, imported, rejected
+
+
+def _row(store, event):
+    return {
+        "name": event.name,
+        "date": event.date,
+        "priority": event.priority,
+        "instructor": event.instructor,
+        "state": event.state,
+        "rating": event.rating,
+        "participants": list(event.participants),
+        "depends_on": store.graph.dependencies(event.name),
+    }
+
+
+def export_file(store, path, fmt=None, chunk_size=10000):
+    """نوشتن جریانی رویدادها به ترتیب تاریخ، بدون ساختن لیست کامل در حافظه"""
+    fmt = _format_of(path, fmt)
+    events = iter(store.tree.by_date)
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = None
+        if fmt == "csv":
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+        while True:
+            chunk = [_row(store, event) for event in islice(events, chunk_size)]
+            if not chunk:
+                return count
+            if writer is not None:
+                for row in chunk:
+                    row["participants"] = ";".join(row["participants"])
+                    row["depends_on"] = ";".join(row["depends_on"])
+                writer.writerows(chunk)
+            else:
+                file.write("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in chunk))
+            count += len(chunk)
+
+
+def cli(argv):
+    """ورودی غیرتعاملی: python main.py import|export ..."""
+    parser = argparse.ArgumentParser(prog="main.py", description="EventFlow bulk import/export")
+    commands = parser.add_subparsers(dest="command", required=True)
+    importer = commands.add_parser("import", help="stream events from CSV/JSONL files into the store")
+    importer.add_argument("paths", nargs="+")
+    importer.add_argument("--format", choices=("csv", "jsonl"))
+    importer.add_argument("--chunk-size", type=int, default=10000)
+    exporter = commands.add_parser("export", help="stream all events to a CSV/JSONL file")
+    exporter.add_argument("path")
+    exporter.add_argument("--format", choices=("csv", "jsonl"))
+    exporter.add_argument("--chunk-size", type=int, default=10000)
+    args = parser.parse_args(argv)
+
+    journal = Journal()
+    store = journal.load()
+    if args.command == "import":
+        errors = []
+        store, imported, rejected = import_files(store, args.paths, args.format, args.chunk_size, errors)
+        journal.snapshot(store)
+        journal.close()
+        for path, line, message in errors[:20]:
+            print(f"{path}:{line}: {message}", file=sys.stderr)
+        if len(errors) > 20:
+            print(f"... {len(errors) - 20} more errors", file=sys.stderr)
+        for dependent, prerequisite in rejected[:20]:
+            print(f"Dependency {dependent} -> {prerequisite} rejected: it would create a cycle.", file=sys.stderr)
+        print(f"Imported {imported} events ({len(errors)} problems reported, {len(rejected)} dependencies rejected).")
+        return 1 if errors else 0
+    count = export_file(store, args.path, args.format, args.chunk_size)
+    journal.close()
+    print(f"Exported {count} events to {args.path}.")
+    return 0
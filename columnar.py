@@ -0,0 +1,160 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from event import Event, VALID_STATES, MIN_PRIORITY, MAX_PRIORITY
+
+MAGIC = b"EVFLOWC1"
+VERSION = 1
+_HEADER = struct.Struct("<8sHBxxxxxQQ")  # نشان، نسخه، ترتیب بایت، seq، تعداد رویداد
+_SECTION = struct.Struct("<cxxxxxxxQ")  # کد نوع آرایه، طول داده بر حسب بایت
+_LITTLE = 0
+_BIG = 1
+
+
+def _write_array(file, values):
+    data = values.tobytes()
+    file.write(_SECTION.pack(values.typecode.encode("ascii"), len(data)))
+    file.write(data)
+    file.write(b"\0" * (-len(data) % 8))  # هم‌ترازی ۸ بایتی بخش بعدی
+
+
+def _write_text(file, strings):
+    """جدول رشته‌ها: آرایه‌ی offset بر حسب کاراکتر و یک بلوک UTF-8"""
+    offsets = array("q", [0])
+    total = 0
+    for value in strings:
+        total += len(value)
+        offsets.append(total)
+    _write_array(file, offsets)
+    _write_array(file, array("B", "".join(strings).encode("utf-8")))
+
+
+def write(path, store, seq=0):
+    """
+    نوشتن عکس‌فوری ستونی دودویی به صورت اتمی
+    هر ستون (نام، تاریخ، اولویت، وضعیت، امتیاز، مدرس، شرکت‌کنندگان، وابستگی‌ها) یک آرایه‌ی پیوسته است.
+    :raises ValueError: اگر مقداری در ستون‌ها جا نشود؛ پیش از ساختن هر فایلی
+    """
+    order = {name: index for index, name in enumerate(store.graph.topological_order())}
+    events = sorted(store, key=lambda event: order.get(event.name, 0))
+    position = {event.name: index for index, event in enumerate(events)}
+    states = {state: index for index, state in enumerate(VALID_STATES)}
+
+    instructors = {}  # مدرس -> شماره در جدول
+    people = {}  # شرکت‌کننده -> شماره در جدول
+    instructor_refs = array("i")
+    participant_offsets = array("q", [0])
+    participant_refs = array("i")
+    for event in events:
+        if not isinstance(event.name, str):
+            raise ValueError(f"event name {event.name!r} is not a string")
+        if not isinstance(event.priority, int) or not MIN_PRIORITY <= event.priority <= MAX_PRIORITY:
+            raise ValueError(f"priority {event.priority!r} of '{event.name}' does not fit in 64 bits")
+        if event.instructor is None:
+            instructor_refs.append(-1)
+        elif isinstance(event.instructor, str):
+            instructor_refs.append(instructors.setdefault(event.instructor, len(instructors)))
+        else:
+            raise ValueError(f"instructor {event.instructor!r} of '{event.name}' is not a string")
+        for participant in event.participants:
+            if not isinstance(participant, str):
+                raise ValueError(f"participant {participant!r} of '{event.name}' is not a string")
+            participant_refs.append(people.setdefault(participant, len(people)))
+        participant_offsets.append(len(participant_refs))
+    edges = array("i")
+    for dependent, prerequisite in store.dependencies():
+        edges.append(position[dependent])
+        edges.append(position[prerequisite])
+    meta = json.dumps({"instructors": store.instructor_ratings.to_dict()}, ensure_ascii=False)
+
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "wb") as file:
+            file.write(_HEADER.pack(MAGIC, VERSION, _LITTLE if sys.byteorder == "little" else _BIG, seq, len(events)))
+            _write_text(file, [event.name for event in events])
+            _write_array(file, array("i", [event.ordinal for event in events]))
+            _write_array(file, array("q", [event.priority for event in events]))
+            _write_array(file, array("b", [states[event.state] for event in events]))
+            _write_array(file, array("b", [event.rating or 0 for event in events]))
+            _write_array(file, instructor_refs)
+            _write_text(file, list(instructors))
+            _write_array(file, participant_offsets)
+            _write_array(file, participant_refs)
+            _write_text(file, list(people))
+            _write_array(file, edges)
+            _write_array(file, array("B", meta.encode("utf-8")))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)  # عکس‌فوری قبلی دست‌نخورده می‌ماند
+        raise
+
+
+class _Reader:
+    def __init__(self, buffer, swap):
+        self.buffer = buffer
+        self.offset = _HEADER.size
+        self.swap = swap
+
+    def array(self):
+        typecode, size = _SECTION.unpack_from(self.buffer, self.offset)
+        start = self.offset + _SECTION.size
+        values = array(typecode.decode("ascii"))
+        values.frombytes(self.buffer[start:start + size])
+        if self.swap and values.itemsize > 1:
+            values.byteswap()
+        self.offset = start + size + (-size % 8)
+        return values
+
+    def text(self):
+        offsets = self.array()
+        blob = self.array().tobytes().decode("utf-8")
+        return [blob[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+
+
+def read(path):
+    """
+    خواندن عکس‌فوری ستونی با mmap
+    :raises ValueError: اگر فایل قالب معتبر نداشته باشد
+    :return: (رویدادها، وابستگی‌ها به صورت جفت نام، seq، متادیتا)
+    """
+    with open(path, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            magic, version, byteorder, seq, count = _HEADER.unpack_from(buffer, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not an EventFlow columnar snapshot")
+            reader = _Reader(buffer, byteorder != (_LITTLE if sys.byteorder == "little" else _BIG))
+            names = reader.text()
+            ordinals = reader.array()
+            priorities = reader.array()
+            states = reader.array()
+            ratings = reader.array()
+            instructor_refs = reader.array()
+            instructors = reader.text()
+            participant_offsets = reader.array()
+            participant_refs = reader.array()
+            people = reader.text()
+            edges = reader.array()
+            meta = json.loads(reader.array().tobytes().decode("utf-8"))
+
+    events = []
+    for i in range(count):
+        ref = instructor_refs[i]
+        event = Event(names[i], ordinals[i], priorities[i], instructors[ref] if ref >= 0 else None)
+        state = states[i]
+        if state:
+            event.state = VALID_STATES[state]
+        if ratings[i]:
+            event.rating = ratings[i]
+        low, high = participant_offsets[i], participant_offsets[i + 1]
+        if low != high:
+            event.participants = dict.fromkeys([people[ref] for ref in participant_refs[low:high]])
+        events.append(event)
+    dependencies = [(names[edges[i]], names[edges[i + 1]]) for i in range(0, len(edges), 2)]
+    return events, dependencies, seq, meta
@@ -1,39 +1,98 @@
+import re
+import sys
+from datetime import date as _date
+from functools import lru_cache
+
+VALID_STATES = ("Not Started", "Ongoing", "Completed")
+MIN_PRIORITY, MAX_PRIORITY = -2 ** 63, 2 ** 63 - 1  # ستون اولویت عکس‌فوری int64 است
+_MAX_ORDINAL = _date.max.toordinal()
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+@lru_cache(maxsize=8192)
+def _parse_date(value):
+    if not _DATE_PATTERN.fullmatch(value):
+        raise ValueError(f"Invalid date '{value}'. Expected YYYY-MM-DD.")
+    return _date.fromisoformat(value).toordinal()
+
+
+@lru_cache(maxsize=8192)
+def _format_date(ordinal):
+    return _date.fromordinal(ordinal).isoformat()
+
+
+def to_ordinal(value):
+    """تبدیل تاریخ (رشته‌ی YYYY-MM-DD، date یا ordinal) به عدد ordinal"""
+    if isinstance(value, int):
+        if not 1 <= value <= _MAX_ORDINAL:
+            raise ValueError(f"Invalid date ordinal {value}.")
+        return value
+    if isinstance(value, str):
+        return _parse_date(value)
+    return value.toordinal()
+
+
+def to_priority(value):
+    """تبدیل اولویت (عدد صحیح یا رشته‌ی عددی) به int در بازه‌ی MIN_PRIORITY تا MAX_PRIORITY"""
+    if isinstance(value, str):
+        value = int(value)
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"Invalid priority {value!r}. Expected an integer.")
+    if not MIN_PRIORITY <= value <= MAX_PRIORITY:
+        raise ValueError(f"Priority {value} is out of range.")
+    return value
+
+
 class Event:
+    __slots__ = ("name", "ordinal", "priority", "instructor", "participants", "state", "rating")
+
     def __init__(self, name, date, priority, instructor=None):
         """
         کلاس مدیریت رویداد
         :param name: نام رویداد
-        :param date: تاریخ برگزاری
+        :param date: تاریخ برگزاری (رشته‌ی YYYY-MM-DD یا ordinal)
         :param priority: اولویت رویداد
         :param instructor: نام مدرس
         """
         self.name = name
-        self.date = date
+        self.ordinal = to_ordinal(date)  # تاریخ به صورت عدد صحیح
         self.priority = priority
-        self.instructor = instructor
-        self.participants = []
+        self.instructor = sys.intern(instructor) if isinstance(instructor, str) else instructor
+        self.participants = ()  # تا اولین ثبت‌نام خالی می‌ماند؛ سپس مجموعه‌ی مرتب dict: نام -> None
         self.state = "Not Started"  # وضعیت پیش‌فرض
         self.rating = None  # امتیاز رویداد
 
+    @property
+    def date(self):
+        """تاریخ برگزاری به صورت رشته‌ی YYYY-MM-DD"""
+        return _format_date(self.ordinal)
+
+    @date.setter
+    def date(self, value):
+        self.ordinal = to_ordinal(value)
+
     def add_participant(self, participant):
         """افزودن شرکت‌کننده به رویداد"""
         if participant not in self.participants:
-            self.participants.append(participant)
+            if not self.participants:
+                self.participants = {}
+            self.participants[participant] = None
             return f"Participant '{participant}' successfully added to '{self.name}'."
         return f"Participant '{participant}' is already registered for '{self.name}'."
 
     def remove_participant(self, participant):
         """حذف شرکت‌کننده از رویداد"""
         if participant in self.participants:
-            self.participants.remove(participant)
+            del self.participants[participant]
             return f"Participant '{participant}' removed from '{self.name}'."
         return f"Participant '{participant}' is not registered for '{self.name}'."
 
     def update_state(self, new_state):
         """به‌روزرسانی وضعیت رویداد"""
-        valid_states = ["Not Started", "Ongoing", "Completed"]
-        if new_state in valid_states:
-            self.state = new_state
+        if new_state in VALID_STATES:
+            self.state = VALID_STATES[VALID_STATES.index(new_state)]  # نمونه‌ی یکتای رشته
             return f"Event '{self.name}' state updated to '{self.state}'."
         return "Invalid state. Valid states: Not Started, Ongoing, Completed."
 
@@ -44,6 +103,29 @@ class Event:
             return f"Event '{self.name}' rated {self.rating} out of 5."
         return "Rating must be between 1 and 5."
 
+    def to_dict(self):
+        """تبدیل رویداد به دیکشنری قابل ذخیره در JSON"""
+        return {
+            "name": self.name,
+            "date": self.date,
+            "priority": self.priority,
+            "instructor": self.instructor,
+            "participants": list(self.participants),
+            "state": self.state,
+            "rating": self.rating,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """ساخت رویداد از دیکشنری ذخیره‌شده"""
+        event = cls(data["name"], data["date"], data["priority"], instructor=data.get("instructor"))
+        participants = data.get("participants")
+        if participants:
+            event.participants = dict.fromkeys(participants)
+        event.update_state(data.get("state", "Not Started"))
+        event.rating = data.get("rating")
+        return event
+
     def __str__(self):
         return f"Event(Name: {self.name}, Date: {self.date}, Priority: {self.priority}, " \
                f"State: {self.state}, Participants: {len(self.participants)})"
@@ -0,0 +1,96 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from heap import MinHeap
+
+
+class BatchReport:
+    def __init__(self, workers):
+        """نتیجه‌ی اجرای موازی: رویدادهای اجراشده، خطاها، زمان کل و میزان موازی‌سازی"""
+        self.workers = workers
+        self.completed = []  # رویدادها به ترتیب اتمام
+        self.failed = []  # (رویداد، استثنا)
+        self.makespan = 0.0  # زمان دیواری از شروع تا پایان آخرین رویداد (ثانیه)
+        self.busy = 0.0  # مجموع زمان اجرای رویدادها
+        self.peak = 0  # بیشترین تعداد رویداد هم‌زمان
+
+    @property
+    def parallelism(self):
+        """میانگین تعداد رویدادهای در حال اجرا در طول makespan"""
+        return self.busy / self.makespan if self.makespan else 0.0
+
+
+def _timed(work, event):
+    start = time.perf_counter()
+    work(event)
+    return time.perf_counter() - start
+
+
+def run_ready(store, work, workers=4, per_instructor=None, limit=None):
+    """
+    اجرای موازی رویدادهای آماده روی مخزن نخ‌ها
+    رویدادها به ترتیب اولویت صف آماده برداشته می‌شوند و هر رویدادی که تمام شود
+    بلافاصله وابسته‌هایش را آزاد می‌کند، پس اجرا تا خالی شدن صف آماده ادامه می‌یابد.
+    تغییر وضعیت‌ها فقط در نخ فراخوان انجام می‌شود؛ نخ‌های کارگر فقط work(event) را اجرا می‌کنند.
+    :param work: تابع کار اجرایی هر رویداد؛ باید thread-safe باشد
+    :param workers: تعداد نخ‌های هم‌زمان
+    :param per_instructor: حداکثر رویداد هم‌زمان هر مدرس؛ None یعنی بدون محدودیت
+    :param limit: حداکثر تعداد رویدادهای اجراشده؛ None یعنی تا خالی شدن صف آماده
+    :return: BatchReport
+    """
+    scheduler = store.scheduler
+    report = BatchReport(workers)
+    running = {}  # future -> رویداد
+    busy_instructors = {}  # مدرس -> تعداد رویدادهای در حال اجرا
+    parked = {}  # مدرس به سقف رسیده -> صف اولویت رویدادهای آماده‌ی او
+    failed = []
+    started = 0
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="execute") as pool:
+        while True:
+            while len(running) < workers and (limit is None or started < limit):
+                event = scheduler.pop()
+                if event is None:
+                    break
+                instructor = event.instructor
+                if per_instructor is not None and instructor and \
+                        busy_instructors.get(instructor, 0) >= per_instructor:
+                    # تا آزاد شدن جای همین مدرس کنار گذاشته می‌شود و دوباره بررسی نمی‌شود
+                    queue = parked.get(instructor)
+                    if queue is None:
+                        queue = parked[instructor] = MinHeap()
+                    queue.insert(event)
+                    continue
+                busy_instructors[instructor] = busy_instructors.get(instructor, 0) + 1
+                store.update_state(event.name, "Ongoing")
+                running[pool.submit(_timed, work, event)] = event
+                started += 1
+            report.peak = max(report.peak, len(running))
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                event = running.pop(future)
+                busy_instructors[event.instructor] -= 1
+                queue = parked.get(event.instructor)
+                if queue is not None:
+                    # جای آزادشده به بهترین رویداد منتظر همین مدرس می‌رسد
+                    scheduler.ready.insert(queue.extract_min())
+                    if not len(queue):
+                        del parked[event.instructor]
+                try:
+                    report.busy += future.result()
+                except Exception as error:
+                    store.update_state(event.name, "Not Started")
+                    report.failed.append((event, error))
+                    failed.append(event)  # تا پایان این اجرا دوباره برداشته نمی‌شود
+                    continue
+                store.update_state(event.name, "Completed")  # وابسته‌ها را به صف آماده می‌آورد
+                report.completed.append(event)
+    report.makespan = time.perf_counter() - begin
+    for queue in parked.values():  # فقط وقتی limit زودتر رسیده باشد
+        while len(queue):
+            scheduler.ready.insert(queue.extract_min())
+    for event in failed:
+        scheduler.ready.insert(event)
+    return report
@@ -1,36 +1,143 @@
 class DirectedGraph:
     def __init__(self):
-        """ایجاد گراف جهت‌دار"""
-        self.graph = {}
+        """
+        ایجاد گراف جهت‌دار با ترتیب توپولوژیک افزایشی (Pearce–Kelly)
+        یال a -> b یعنی رویداد a به رویداد b وابسته است.
+        """
+        self.graph = {}  # رویداد -> {پیش‌نیاز: None}
+        self.reverse = {}  # رویداد -> {وابسته: None}
+        self._order = {}  # رویداد -> جایگاه در ترتیب توپولوژیک (پیش‌نیاز زودتر)
+        self._next_order = 0
 
     def add_event(self, event_name):
         if event_name not in self.graph:
-            self.graph[event_name] = []
+            self.graph[event_name] = {}
+            self.reverse[event_name] = {}
+            self._order[event_name] = self._next_order
+            self._next_order += 1
 
-    def add_dependency(self, event_a, event_b):
-        """افزودن وابستگی بین دو رویداد"""
-        if event_a in self.graph and event_b in self.graph:
-            self.graph[event_a].append(event_b)
+    def bulk_load(self, event_names, dependencies):
+        """
+        افزودن یک‌جای رویدادها و وابستگی‌ها
+        رویدادها به ترتیب توپولوژیک (Kahn) اضافه می‌شوند تا هر یال بدون جابه‌جایی ترتیب پذیرفته شود؛
+        یال‌هایی که چرخه می‌سازند مانند add_dependency رد می‌شوند.
+        :return: لیست وابستگی‌های ردشده
+        """
+        names = [name for name in dict.fromkeys(event_names) if name not in self.graph]
+        dependencies = list(dependencies)
+        known = set(names)
+        prerequisites = {}
+        dependents = {}
+        for dependent, prerequisite in dependencies:
+            if dependent in known and prerequisite in known:
+                seen = prerequisites.setdefault(dependent, set())
+                if prerequisite not in seen:
+                    seen.add(prerequisite)
+                    dependents.setdefault(prerequisite, []).append(dependent)
+        remaining = {name: len(prerequisites.get(name, ())) for name in names}
+        ready = [name for name in reversed(names) if remaining[name] == 0]
+        while ready:
+            name = ready.pop()
+            self.add_event(name)
+            for dependent in dependents.get(name, ()):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        for name in names:
+            self.add_event(name)  # رویدادهای باقی‌مانده روی چرخه‌ها
+        rejected = []
+        for dependent, prerequisite in dependencies:
+            if not self.add_dependency(dependent, prerequisite):
+                rejected.append((dependent, prerequisite))
+        return rejected
 
-    def has_cycle(self):
-        """تشخیص وجود چرخه در گراف"""
-        visited = set()
-        stack = set()
-
-        def dfs(node):
-            if node in stack:
-                return True
-            if node in visited:
+    def remove_event(self, event_name):
+        """حذف رویداد و همه‌ی وابستگی‌های مربوط به آن"""
+        if event_name not in self.graph:
+            return False
+        for prerequisite in self.graph.pop(event_name):
+            del self.reverse[prerequisite][event_name]
+        for dependent in self.reverse.pop(event_name):
+            del self.graph[dependent][event_name]
+        del self._order[event_name]
+        return True
+
+    def add_dependency(self, event_a, event_b):
+        """
+        افزودن وابستگی a -> b؛ اگر چرخه ایجاد کند رد می‌شود
+        :return: True در صورت ثبت وابستگی، False در صورت رد
+        """
+        if event_a not in self.graph or event_b not in self.graph or event_a == event_b:
+            return False
+        if event_b in self.graph[event_a]:
+            return True
+        lower = self._order[event_a]
+        upper = self._order[event_b]
+        if lower < upper:
+            forward = self._collect(event_a, self.reverse, lambda o: o <= upper, event_b)
+            if forward is None:
                 return False
-            visited.add(node)
-            stack.add(node)
-            for neighbor in self.graph.get(node, []):
-                if dfs(neighbor):
-                    return True
-            stack.remove(node)
+            backward = self._collect(event_b, self.graph, lambda o: o >= lower)
+            self._reorder(backward, forward)
+        self.graph[event_a][event_b] = None
+        self.reverse[event_b][event_a] = None
+        return True
+
+    def _collect(self, start, edges, in_region, target=None):
+        """پیمایش غیربازگشتی ناحیه‌ی آسیب‌دیده؛ رسیدن به target یعنی چرخه"""
+        order = self._order
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for neighbor in edges[node]:
+                if neighbor == target:
+                    return None
+                if neighbor not in seen and in_region(order[neighbor]):
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+        return seen
+
+    def _reorder(self, backward, forward):
+        order = self._order
+        nodes = sorted(backward, key=order.get) + sorted(forward, key=order.get)
+        slots = sorted(order[node] for node in nodes)
+        for node, slot in zip(nodes, slots):
+            order[node] = slot
+
+    def remove_dependency(self, event_a, event_b):
+        """حذف وابستگی a -> b"""
+        if event_b not in self.graph.get(event_a, {}):
             return False
+        del self.graph[event_a][event_b]
+        del self.reverse[event_b][event_a]
+        return True
+
+    def dependencies(self, event_name):
+        """پیش‌نیازهای مستقیم یک رویداد"""
+        return list(self.graph.get(event_name, ()))
+
+    def dependents(self, event_name):
+        """رویدادهایی که مستقیماً به این رویداد وابسته‌اند"""
+        return list(self.reverse.get(event_name, ()))
 
-        for node in self.graph:
-            if dfs(node):
-                return True
-        return False
+    def edge_count(self):
+        return sum(len(prerequisites) for prerequisites in self.graph.values())
+
+    def topological_order(self):
+        """ترتیب اجرای رویدادها به‌طوری که هر پیش‌نیاز قبل از وابسته‌هایش بیاید"""
+        return sorted(self._order, key=self._order.get)
+
+    def has_cycle(self):
+        """تشخیص وجود چرخه در گراف (الگوریتم Kahn، بدون بازگشت)"""
+        remaining = {node: len(prerequisites) for node, prerequisites in self.graph.items()}
+        ready = [node for node, count in remaining.items() if count == 0]
+        visited = 0
+        while ready:
+            node = ready.pop()
+            visited += 1
+            for dependent in self.reverse[node]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        return visited != len(self.graph)
@@ -1,19 +1,152 @@
+_EMPTY = object()
+_DELETED = object()
+
+
 class HashTable:
+    MIN_SIZE = 8
+    MAX_LOAD = 0.66
+    MIN_LOAD = 0.16
+
     def __init__(self, size=10):
-        self.size = size
-        self.table = [[] for _ in range(size)]
+        """
+        جدول درهم‌سازی با آدرس‌دهی باز و تغییر اندازه‌ی خودکار
+        :param size: ظرفیت اولیه (به توان دو گرد می‌شود)
+        """
+        capacity = self.MIN_SIZE
+        while capacity < size:
+            capacity *= 2
+        self._reset(capacity)
+
+    def _reset(self, capacity):
+        self.size = capacity
+        self._mask = capacity - 1
+        self._hashes = [0] * capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._count = 0
+        self._used = 0  # خانه‌های پر به‌همراه خانه‌های حذف‌شده
+
+    def _probe(self, key, h):
+        """یافتن خانه‌ی کلید یا اولین خانه‌ی آزاد برای درج"""
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        index = h & mask
+        perturb = h & 0xFFFFFFFFFFFFFFFF
+        free = -1
+        while True:
+            k = keys[index]
+            if k is _EMPTY:
+                return (free if free >= 0 else index), False
+            if k is _DELETED:
+                if free < 0:
+                    free = index
+            elif hashes[index] == h and (k is key or k == key):
+                return index, True
+            perturb >>= 5
+            index = (5 * index + 1 + perturb) & mask
+
+    def _resize(self, capacity):
+        old = zip(self._hashes, self._keys, self._values)
+        self._reset(capacity)
+        keys = self._keys
+        hashes = self._hashes
+        values = self._values
+        mask = self._mask
+        for h, k, v in old:
+            if k is _EMPTY or k is _DELETED:
+                continue
+            index = h & mask
+            perturb = h & 0xFFFFFFFFFFFFFFFF
+            while keys[index] is not _EMPTY:
+                perturb >>= 5
+                index = (5 * index + 1 + perturb) & mask
+            hashes[index] = h
+            keys[index] = k
+            values[index] = v
+            self._count += 1
+        self._used = self._count
 
     def insert(self, key, value):
-        index = hash(key) % self.size
-        for pair in self.table[index]:
-            if pair[0] == key:
-                pair[1] = value
-                return
-        self.table[index].append([key, value])
-
-    def get(self, key):
-        index = hash(key) % self.size
-        for pair in self.table[index]:
-            if pair[0] == key:
-                return pair[1]
-        return None
+        """درج یا به‌روزرسانی مقدار یک کلید"""
+        h = hash(key)
+        index, found = self._probe(key, h)
+        if found:
+            self._values[index] = value
+            return
+        if self._keys[index] is _EMPTY:
+            self._used += 1
+        self._hashes[index] = h
+        self._keys[index] = key
+        self._values[index] = value
+        self._count += 1
+        if self._used > self.size * self.MAX_LOAD:
+            self._resize(self._grow_target())
+
+    def get(self, key, default=None):
+        """بازگرداندن مقدار یک کلید یا مقدار پیش‌فرض"""
+        index, found = self._probe(key, hash(key))
+        if found:
+            return self._values[index]
+        return default
+
+    def delete(self, key):
+        """حذف یک کلید؛ در صورت وجود True برمی‌گرداند"""
+        index, found = self._probe(key, hash(key))
+        if not found:
+            return False
+        self._keys[index] = _DELETED
+        self._values[index] = None
+        self._count -= 1
+        if self.size > self.MIN_SIZE and self._count < self.size * self.MIN_LOAD:
+            self._resize(self._grow_target())
+        return True
+
+    def _grow_target(self):
+        capacity = self.MIN_SIZE
+        while capacity * self.MAX_LOAD <= self._count * 2:
+            capacity *= 2
+        return capacity
+
+    def probe_lengths(self):
+        """طول دنباله‌ی جست‌وجوی هر کلید (معادل طول زنجیره در جدول زنجیره‌ای)"""
+        keys = self._keys
+        mask = self._mask
+        for slot, (h, k) in enumerate(zip(self._hashes, keys)):
+            if k is _EMPTY or k is _DELETED:
+                continue
+            index = h & mask
+            perturb = h & 0xFFFFFFFFFFFFFFFF
+            length = 1
+            while index != slot:
+                perturb >>= 5
+                index = (5 * index + 1 + perturb) & mask
+                length += 1
+            yield length
+
+    def __contains__(self, key):
+        return self._probe(key, hash(key))[1]
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        return self.keys()
+
+    def keys(self):
+        """پیمایش کلیدها"""
+        for k in self._keys:
+            if k is not _EMPTY and k is not _DELETED:
+                yield k
+
+    def values(self):
+        """پیمایش مقادیر"""
+        for k, v in zip(self._keys, self._values):
+            if k is not _EMPTY and k is not _DELETED:
+                yield v
+
+    def items(self):
+        """پیمایش جفت‌های (کلید، مقدار)"""
+        for k, v in zip(self._keys, self._values):
+            if k is not _EMPTY and k is not _DELETED:
+                yield k, v
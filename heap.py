@@ -2,51 +2,121 @@ class MinHeap:
     def __init__(self):
         """ایجاد صف اولویت"""
         self.heap = []
+        self._keys = []  # کلید مقایسه‌ی (priority, date ordinal) هر خانه
+        self._index = {}  # نام رویداد -> جایگاه در heap
+
+    @classmethod
+    def heapify(cls, events):
+        """ساخت صف اولویت از مجموعه‌ای از رویدادها در زمان O(n)"""
+        instance = cls()
+        for event in events:
+            if event.name in instance._index:
+                position = instance._index[event.name]
+                instance.heap[position] = event
+                instance._keys[position] = cls._key(event)
+                continue
+            instance._index[event.name] = len(instance.heap)
+            instance.heap.append(event)
+            instance._keys.append(cls._key(event))
+        for index in range(len(instance.heap) // 2 - 1, -1, -1):
+            instance._heapify_down(index)
+        return instance
+
+    @staticmethod
+    def _key(event):
+        return (event.priority, event.ordinal)
 
     def insert(self, event):
-        """افزودن رویداد به صف اولویت"""
+        """افزودن رویداد به صف اولویت (رویداد هم‌نام جایگزین می‌شود)"""
+        if event.name in self._index:
+            self.remove(event.name)
+        self._index[event.name] = len(self.heap)
         self.heap.append(event)
+        self._keys.append(self._key(event))
         self._heapify_up(len(self.heap) - 1)
 
     def extract_min(self):
         """حذف و بازگرداندن کم‌اولویت‌ترین رویداد"""
         if len(self.heap) == 0:
             return None
-        self._swap(0, len(self.heap) - 1)
-        min_event = self.heap.pop()
-        self._heapify_down(0)
-        return min_event
+        return self._remove_at(0)
 
     def peek(self):
         """مشاهده کم‌اولویت‌ترین رویداد"""
         if len(self.heap) == 0:
             return None
         return self.heap[0]
-    
 
+    def remove(self, name):
+        """حذف رویداد با نام داده‌شده در زمان O(log n)"""
+        index = self._index.get(name)
+        if index is None:
+            return None
+        return self._remove_at(index)
+
+    def update_priority(self, name, new_priority):
+        """تغییر اولویت یک رویداد و بازگرداندن آن به جایگاه درست"""
+        index = self._index.get(name)
+        if index is None:
+            return False
+        event = self.heap[index]
+        event.priority = new_priority
+        self._keys[index] = self._key(event)
+        self._heapify_up(index)
+        self._heapify_down(self._index[name])
+        return True
+
+    def contains(self, name):
+        """بررسی وجود رویداد در صف اولویت"""
+        return name in self._index
 
-    def _compare(self, event1, event2):
-        if event1.priority == event2.priority:
-            return event1.date < event2.date  # مقایسه تاریخ
-        return event1.priority < event2.priority  # تصحیح خطا
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _remove_at(self, index):
+        last = len(self.heap) - 1
+        if index != last:
+            self._swap(index, last)
+        event = self.heap.pop()
+        self._keys.pop()
+        del self._index[event.name]
+        if index < last:
+            self._heapify_up(index)
+            self._heapify_down(index)
+        return event
+
+    def _compare(self, index1, index2):
+        return self._keys[index1] < self._keys[index2]
 
     def _heapify_up(self, index):
-        while index > 0 and self._compare(self.heap[index], self.heap[(index - 1) // 2]):
+        while index > 0 and self._compare(index, (index - 1) // 2):
             self._swap(index, (index - 1) // 2)
             index = (index - 1) // 2
 
     def _heapify_down(self, index):
-        smallest = index
-        left = 2 * index + 1
-        right = 2 * index + 2
+        size = len(self.heap)
+        while True:
+            smallest = index
+            left = 2 * index + 1
+            right = left + 1
 
-        if left < len(self.heap) and self._compare(self.heap[left], self.heap[smallest]):
-            smallest = left
-        if right < len(self.heap) and self._compare(self.heap[right], self.heap[smallest]):
-            smallest = right
+            if left < size and self._compare(left, smallest):
+                smallest = left
+            if right < size and self._compare(right, smallest):
+                smallest = right
 
-        if smallest != index:
+            if smallest == index:
+                return
             self._swap(index, smallest)
-            self._heapify_down(smallest)
+            index = smallest
+
     def _swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        heap = self.heap
+        keys = self._keys
+        heap[i], heap[j] = heap[j], heap[i]
+        keys[i], keys[j] = keys[j], keys[i]
+        self._index[heap[i].name] = i
+        self._index[heap[j].name] = j
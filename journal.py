@@ -0,0 +1,147 @@
+import gc
+import json
+import os
+
+import columnar
+from event import Event
+from store import EventStore
+
+
+class Journal:
+    def __init__(self, directory=".", name="events", sync_every=64, compact_every=10000):
+        """
+        دفتر ثبت تغییرات فقط‌افزودنی همراه با عکس‌فوری (snapshot) فشرده
+        :param directory: پوشه‌ی فایل‌های دفتر و عکس‌فوری
+        :param name: پیشوند نام فایل‌ها
+        :param sync_every: تعداد رکوردها بین دو فراخوانی fsync
+        :param compact_every: تعداد رکوردهای دفتر پیش از ساخت عکس‌فوری جدید
+        """
+        self.journal_path = os.path.join(directory, f"{name}.journal")
+        self.snapshot_path = os.path.join(directory, f"{name}.snapshot")
+        self.legacy_snapshot_path = os.path.join(directory, f"{name}.snapshot.json")  # قالب JSON نسخه‌های قبلی
+        self.sync_every = sync_every
+        self.compact_every = compact_every
+        self.seq = 0  # شماره‌ی آخرین رکورد ثبت‌شده
+        self._unsynced = 0
+        self._tail = 0  # تعداد رکوردهای دفتر پس از آخرین عکس‌فوری
+        self._file = None
+
+    def _open(self):
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        return self._file
+
+    def append(self, op, **fields):
+        """افزودن یک رکورد تغییر به انتهای دفتر"""
+        self.seq += 1
+        record = {"seq": self.seq, "op": op}
+        record.update(fields)
+        self._open().write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._tail += 1
+        self._unsynced += 1
+        if self._unsynced >= self.sync_every:
+            self.flush()
+
+    def flush(self):
+        """نوشتن بافر و fsync دفتر روی دیسک"""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def should_compact(self):
+        return self._tail >= self.compact_every
+
+    def snapshot(self, store):
+        """نوشتن عکس‌فوری ستونی کامل به صورت اتمی و خالی کردن دفتر"""
+        columnar.write(self.snapshot_path, store, self.seq)
+        if os.path.exists(self.legacy_snapshot_path):
+            os.remove(self.legacy_snapshot_path)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        open(self.journal_path, "w").close()
+        self._tail = 0
+        self._unsynced = 0
+
+    def load(self):
+        """بارگذاری آخرین عکس‌فوری و بازپخش رکوردهای بعد از آن"""
+        snapshot_seq = 0
+        store = EventStore()
+        data = None
+        if os.path.exists(self.snapshot_path):
+            collecting = gc.isenabled()
+            gc.disable()  # میلیون‌ها شیء جدید بدون چرخه؛ جمع‌آوری زباله در این مرحله فقط هزینه است
+            try:
+                events, dependencies, snapshot_seq, data = columnar.read(self.snapshot_path)
+                store = EventStore.from_events(events, dependencies)
+            finally:
+                if collecting:
+                    gc.enable()
+        elif os.path.exists(self.legacy_snapshot_path):
+            with open(self.legacy_snapshot_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            snapshot_seq = data.get("seq", 0)
+            store = EventStore.from_events([Event.from_dict(event) for event in data.get("events", [])],
+                                           dependencies=data.get("dependencies", []))
+        if data is not None:
+            for name, ratings in data.get("instructors", {}).items():
+                if isinstance(ratings, dict):
+                    store.instructor_ratings.restore(name, ratings["histogram"])
+                else:  # عکس‌فوری‌های قدیمی لیست کامل امتیازها را دارند
+                    for rating in ratings:
+                        store.instructor_ratings.add(name, rating)
+        self.seq = snapshot_seq
+        self._tail = 0
+        if os.path.exists(self.journal_path):
+            valid = 0
+            with open(self.journal_path, "rb") as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break  # سطر آخر بدون \n نیمه‌کاره است، حتی اگر JSON معتبری باشد
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break  # رکورد نیمه‌کاره‌ی انتهای دفتر پس از خرابی
+                    valid += len(line)
+                    if record["seq"] <= snapshot_seq:
+                        continue
+                    replay(store, record)
+                    self.seq = record["seq"]
+                    self._tail += 1
+            if valid < os.path.getsize(self.journal_path):
+                with open(self.journal_path, "r+b") as file:
+                    file.truncate(valid)
+        store.journal = self
+        return store
+
+    def close(self):
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def replay(store, record):
+    """اعمال یک رکورد دفتر روی مخزن بدون ثبت دوباره‌ی آن"""
+    journal, store.journal = store.journal, None
+    try:
+        op = record["op"]
+        if op == "add_event":
+            store.add(Event.from_dict(record["event"]))
+        elif op == "remove_event":
+            store.remove(record["name"])
+        elif op == "update_state":
+            store.update_state(record["name"], record["state"])
+        elif op == "add_dependency":
+            store.add_dependency(record["dependent"], record["prerequisite"])
+        elif op == "remove_dependency":
+            store.remove_dependency(record["dependent"], record["prerequisite"])
+        elif op == "add_participant":
+            store.add_participant(record["name"], record["participant"])
+        elif op == "rate_event":
+            store.rate_event(record["name"], record["rating"])
+        elif op == "rate_instructor":
+            store.rate_instructor(record["instructor"], record["rating"])
+    finally:
+        store.journal = journal
@@ -1,30 +1,26 @@
-from event import Event
-from heap import MinHeap
-from graph import DirectedGraph
-from hash_table import HashTable
-from tree import EventTree
-from datetime import datetime
+from event import Event, to_ordinal, to_priority
+from store import EventStore
+from journal import Journal
+from audit_log import AuditLogger
+from notifications import NotificationDispatcher, FileSink
+from executor import run_ready
+import metrics
 import json
+import os
+import sys
 
 
 def validate_date(date_str):
-    """Validate date format (YYYY-MM-DD)."""
+    """Validate date format (YYYY-MM-DD); parsed dates are cached."""
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        to_ordinal(date_str)
         return True
     except ValueError:
         return False
 
 
-def save_data(event_list, filename="events.json"):
-    """Save event data to a JSON file."""
-    data = [event.to_dict() for event in event_list]
-    with open(filename, "w") as file:
-        json.dump(data, file)
-
-
 def load_data(filename="events.json"):
-    """Load event data from a JSON file."""
+    """Load event data from a legacy full-file JSON save."""
     try:
         with open(filename, "r") as file:
             data = json.load(file)
@@ -33,27 +29,61 @@ def load_data(filename="events.json"):
         return []
 
 
-def log_action(action, filename="event_log.txt"):
-    """Log an action to a log file."""
-    with open(filename, "a") as log_file:
-        log_file.write(f"{datetime.now()}: {action}\n")
+audit_log = AuditLogger()  # Batched background writer for the JSON-lines action log
+
+
+def log_action(action, event_name=None, **payload):
+    """Queue a structured action record for the audit log."""
+    audit_log.log(action, event_name, **payload)
+
+
+notifier = NotificationDispatcher([FileSink("notifications.jsonl")])  # Background delivery to the outbox file
+
+
+PAGE_SIZE = 50  # Events shown per page of a categorized view
+
+VIEW_FORMATS = {
+    "date": ("Date", lambda event: f"{event.name} - {event.date}"),
+    "participants": ("Participants", lambda event: f"{event.name} - {len(event.participants)} participants"),
+    "instructor": ("Instructor", lambda event: f"{event.name} - Instructor: {event.instructor}"),
+    "status": ("Status", lambda event: f"{event.name} - {event.state}"),
+    "rating": ("Rating", lambda event: f"{event.name} - "
+                                       f"{f'{event.rating}/5' if event.rating is not None else 'Not rated'}"),
+}
+
+
+def print_view_page(store, view, page):
+    """Print one page of a sorted view without materializing the rest of it."""
+    title, describe = VIEW_FORMATS[view]
+    total = len(store.tree.view(view))
+    pages = max(1, -(-total // PAGE_SIZE))
+    print(f"\nCategorized Events by {title} (page {min(page, pages)} of {pages}, {total} events):")
+    for event in store.tree.page(view, (min(page, pages) - 1) * PAGE_SIZE, PAGE_SIZE):
+        print(describe(event))
+
+
+MENU_ACTIONS = {
+    "1": "add_event", "2": "view_next", "3": "execute_event", "4": "add_dependency",
+    "5": "check_cycles", "6": "add_participant", "7": "search_event", "8": "remove_event",
+    "9": "notify_participants", "10": "categorize_events", "11": "check_overlaps",
+    "12": "view_by_status", "13": "rate_event", "14": "rate_instructor",
+    "15": "view_instructor_ratings", "16": "save_and_exit", "17": "dump_metrics",
+    "18": "participant_schedule", "19": "execute_ready_batch",
+}
 
 
 def main():
-    event_heap = MinHeap()  # Priority queue for event management
-    event_graph = DirectedGraph()  # Directed graph for dependencies
-    participants = HashTable()  # Hash table for participant management
-    instructors = HashTable()  # Hash table for instructor ratings
-    event_list = load_data()  # Load events from JSON file
-    event_tree = EventTree()  # Tree for event categorization
-
-    # Rebuild data structures from loaded events
-    for event in event_list:
-        event_heap.insert(event)
-        event_graph.add_event(event.name)
-        event_tree.insert_by_date(event)
-        event_tree.insert_by_participants(event)
-        event_tree.insert_by_instructor(event)
+    if os.environ.get("EVENTFLOW_METRICS"):
+        metrics.enable()  # Opt-in: structures run uninstrumented unless this is set
+    journal = Journal()  # Append-only journal of every change, compacted into snapshots
+    store = journal.load()  # Heap, graph, trees and indexes over all events
+    if not len(store):
+        legacy_events = load_data()
+        if legacy_events:
+            store = EventStore.from_events(legacy_events)
+            store.journal = journal
+            journal.snapshot(store)
+    metrics.watch_store(store)
 
     while True:
         print("\n--- Event Management System ---")
@@ -73,8 +103,12 @@ def main():
         print("14. Rate Instructor")
         print("15. View Instructor Ratings")
         print("16. Save and Exit")
+        print("17. Dump Metrics")
+        print("18. View Participant Schedule")
+        print("19. Execute Ready Events in Parallel")
 
         choice = input("Enter your choice: ")
+        started = metrics.start()  # None unless instrumentation is enabled
 
         if choice == "1":
             name = input("Enter event name: ")
@@ -84,22 +118,22 @@ def main():
                 date = input("Enter event date (YYYY-MM-DD): ")
 
             try:
-                priority = int(input("Enter event priority (integer): "))
+                priority = to_priority(input("Enter event priority (integer): "))
                 instructor = input("Enter the instructor's name: ")
                 event = Event(name, date, priority, instructor=instructor)
-                event_heap.insert(event)
-                event_graph.add_event(name)
-                event_list.append(event)
-                event_tree.insert_by_date(event)
-                event_tree.insert_by_participants(event)
-                event_tree.insert_by_instructor(event)
-                print(f"Event '{name}' added successfully.")
-                log_action(f"Added event: {name}")
+                if store.add(event):
+                    print(f"Event '{name}' added successfully.")
+                    log_action("add_event", name, date=date, priority=priority, instructor=instructor)
+                    conflicts = store.overlaps.conflicts_with(event)
+                    if conflicts:
+                        print(f"Warning: '{name}' overlaps with {', '.join(e.name for e in conflicts)}.")
+                else:
+                    print(f"Event '{name}' already exists.")
             except ValueError:
-                print("Priority must be an integer.")
+                print("Priority must be a 64-bit integer.")
 
         elif choice == "2":
-            next_event = event_heap.peek()
+            next_event = store.heap.peek()
             if next_event:
                 print("\nNext Event in Priority Queue:")
                 print(next_event)
@@ -107,35 +141,36 @@ def main():
                 print("No events available.")
 
         elif choice == "3":
-            next_event = event_heap.peek()
+            next_event = store.scheduler.peek()  # Highest-priority event whose dependencies are all completed
             if next_event:
-                dependencies = event_graph.graph.get(next_event.name, [])
-                unresolved = [dep for dep in dependencies if dep not in [e.name for e in event_list if e.state == "Completed"]]
-                if unresolved:
-                    print(f"Cannot execute '{next_event.name}'. Pending dependencies: {', '.join(unresolved)}")
-                else:
-                    next_event = event_heap.extract_min()
-                    next_event.update_state("Ongoing")
-                    print(f"Notification: Event '{next_event.name}' is now ongoing.")
-                    participants_list = participants.get(next_event.name) or []
-                    print(f"Executing event: {next_event.name}")
-                    print(f"Number of participants: {len(participants_list)}")
-                    next_event.update_state("Completed")
-                    print(f"Event '{next_event.name}' completed successfully.")
-                    log_action(f"Executed event: {next_event.name}")
+                store.update_state(next_event.name, "Ongoing")
+                print(f"Notification: Event '{next_event.name}' is now ongoing.")
+                participants_list = store.participants_of(next_event.name)
+                print(f"Executing event: {next_event.name}")
+                print(f"Number of participants: {len(participants_list)}")
+                store.update_state(next_event.name, "Completed")
+                print(f"Event '{next_event.name}' completed successfully.")
+                log_action("execute_event", next_event.name)
+            elif len(store.heap):
+                blocked = store.heap.peek()
+                unresolved = store.pending_dependencies(blocked.name)
+                print(f"Cannot execute any event. '{blocked.name}' is waiting on: {', '.join(unresolved)}")
+            else:
+                print("No events available.")
 
         elif choice == "4":
             event_a = input("Enter the name of the first event (must happen first): ")
             event_b = input("Enter the name of the second event (depends on the first): ")
-            if event_a in [e.name for e in event_list] and event_b in [e.name for e in event_list]:
-                event_graph.add_dependency(event_b, event_a)
+            if event_a not in store or event_b not in store:
+                print("One or both events not found.")
+            elif store.add_dependency(event_b, event_a):
                 print(f"Dependency added: {event_b} -> {event_a}")
-                log_action(f"Added dependency: {event_b} -> {event_a}")
+                log_action("add_dependency", event_b, prerequisite=event_a)
             else:
-                print("One or both events not found.")
+                print(f"Dependency {event_b} -> {event_a} rejected: it would create a cycle.")
 
         elif choice == "5":
-            if event_graph.has_cycle():
+            if store.graph.has_cycle():
                 print("Cycle detected in the dependencies!")
             else:
                 print("No cycles detected in the dependencies.")
@@ -143,24 +178,24 @@ def main():
         elif choice == "6":
             event_name = input("Enter the event name: ")
             participant_name = input("Enter the participant's name: ")
-            found_event = next((event for event in event_list if event.name == event_name), None)
-            if found_event:
-                participants_list = participants.get(event_name) or []
-                if participant_name in participants_list:
+            if event_name in store:
+                if not store.add_participant(event_name, participant_name):
                     print(f"Participant '{participant_name}' is already registered for event '{event_name}'.")
                 else:
-                    participants_list.append(participant_name)
-                    participants.insert(event_name, participants_list)
                     print(f"Participant '{participant_name}' added to event '{event_name}'.")
-                    log_action(f"Added participant '{participant_name}' to event '{event_name}'")
+                    log_action("add_participant", event_name, participant=participant_name)
+                    clashes = store.booking_conflicts(event_name, participant_name)
+                    if clashes:
+                        print(f"Warning: '{participant_name}' is already booked for "
+                              f"{', '.join(f'{e.name} ({e.date})' for e in clashes)}.")
             else:
                 print(f"Event '{event_name}' not found.")
 
         elif choice == "7":
             event_name = input("Enter the event name to search: ")
-            found_event = next((event for event in event_list if event.name == event_name), None)
+            found_event = store.get(event_name)
             if found_event:
-                participants_list = participants.get(event_name) or []
+                participants_list = store.participants_of(event_name)
                 print("\nEvent Details:")
                 print(found_event)
                 print(f"Participants: {', '.join(participants_list) if participants_list else 'None'}")
@@ -169,55 +204,49 @@ def main():
 
         elif choice == "8":
             event_name = input("Enter the event name to remove: ")
-            found_event = next((event for event in event_list if event.name == event_name), None)
-            if found_event:
-                event_list.remove(found_event)
-                event_heap.heap = [event for event in event_heap.heap if event.name != event_name]
-                participants.insert(event_name, [])
+            if store.remove(event_name):
                 print(f"Event '{event_name}' removed successfully.")
-                log_action(f"Removed event: {event_name}")
+                log_action("remove_event", event_name)
             else:
                 print(f"Event '{event_name}' not found.")
 
         elif choice == "9":
             event_name = input("Enter the event name to notify participants: ")
-            participants_list = participants.get(event_name)
+            participants_list = store.participants_of(event_name)
             if participants_list:
-                print(f"Notifying participants of '{event_name}'...")
+                previous = notifier.summary(event_name)
+                if any(previous.values()):
+                    print(f"Earlier notifications: {previous['sent']} sent, "
+                          f"{previous['queued'] + previous['retrying']} pending, {previous['failed']} failed.")
                 message = input("Enter the message to send: ")
-                for participant in participants_list:
-                    print(f"Notification sent to {participant}: {message}")
-                log_action(f"Notified participants of event '{event_name}'")
+                queued = notifier.notify(event_name, participants_list, message)
+                print(f"Queued {queued} notifications for '{event_name}'; delivery continues in the background.")
+                log_action("notify_participants", event_name, recipients=len(participants_list))
             else:
                 print(f"No participants found for event '{event_name}'. Check the event name and try again.")
 
         elif choice == "10":
-            print("\nCategorized Events by Date:")
-            events_by_date = event_tree.inorder_by_date()
-            for event in events_by_date:
-                print(f"{event.name} - {event.date}")
-
-            print("\nCategorized Events by Participants:")
-            events_by_participants = event_tree.inorder_by_participants()
-            for event in events_by_participants:
-                print(f"{event.name} - {len(event.participants)} participants")
-
-            print("\nCategorized Events by Instructor:")
-            events_by_instructor = event_tree.inorder_by_instructor()
-            for event in events_by_instructor:
-                print(f"{event.name} - Instructor: {event.instructor}")
+            for view in ("date", "participants", "instructor"):
+                print_view_page(store, view, 1)
+            while True:
+                request = input("\nEnter a view (date, participants, instructor, status, rating) and page number "
+                                "to browse, e.g. 'status 2', or press Enter to return: ").split()
+                if not request:
+                    break
+                view = request[0].lower()
+                if view not in store.tree.VIEWS or len(request) > 2 or \
+                        (len(request) == 2 and not (request[1].isdigit() and int(request[1]) > 0)):
+                    print("Unknown view or page number.")
+                    continue
+                print_view_page(store, view, int(request[1]) if len(request) == 2 else 1)
 
         elif choice == "11":
-            overlaps = []
-            for i, event1 in enumerate(event_list):
-                for event2 in event_list[i + 1:]:
-                    if event1.date == event2.date:
-                        overlaps.append((event1, event2))
+            overlaps = store.overlaps.conflicts()
             if overlaps:
                 print("Overlapping Events Found:")
                 for event1, event2 in overlaps:
                     print(f"{event1.name} and {event2.name} overlap.")
-                log_action("Detected overlapping events.")
+                log_action("detect_overlaps", pairs=len(overlaps))
             else:
                 print("No overlapping events found.")
 
@@ -225,23 +254,21 @@ def main():
             print("Events by Status:")
             for status in ["Not Started", "Ongoing", "Completed"]:
                 print(f"\nStatus: {status}")
-                for event in event_list:
-                    if event.state == status:
-                        print(f"- {event.name} ({event.date})")
+                for event in store.by_state(status):
+                    print(f"- {event.name} ({event.date})")
 
         elif choice == "13":
             print("Events eligible for rating (Completed):")
-            for event in event_list:
-                if event.state == "Completed":
-                    print(f"- {event.name}")
+            for event in store.by_state("Completed"):
+                print(f"- {event.name}")
             event_name = input("Enter the event name to rate: ")
-            found_event = next((event for event in event_list if event.name == event_name), None)
+            found_event = store.get(event_name)
             if found_event and found_event.state == "Completed":
                 try:
                     rating = int(input("Enter rating (1-5): "))
                     if 1 <= rating <= 5:
-                        found_event.rate_event(rating)
-                        log_action(f"Rated event '{event_name}' with {rating}/5")
+                        store.rate_event(event_name, rating)
+                        log_action("rate_event", event_name, rating=rating)
                         print(f"Event '{event_name}' rated {rating}/5.")
                     else:
                         print("Rating must be between 1 and 5.")
@@ -255,29 +282,102 @@ def main():
             try:
                 rating = int(input("Enter rating (1-5): "))
                 if 1 <= rating <= 5:
-                    current_rating = instructors.get(instructor_name) or []
-                    current_rating.append(rating)
-                    instructors.insert(instructor_name, current_rating)
+                    store.rate_instructor(instructor_name, rating)
                     print(f"Rated instructor '{instructor_name}' with {rating}/5.")
-                    log_action(f"Rated instructor '{instructor_name}' with {rating}/5.")
+                    log_action("rate_instructor", instructor=instructor_name, rating=rating)
                 else:
                     print("Rating must be between 1 and 5.")
             except ValueError:
                 print("Invalid input. Please enter a number between 1 and 5.")
 
         elif choice == "15":
-            all_instructors = [(name, sum(ratings) / len(ratings)) for name, ratings in instructors.table if ratings]
-            sorted_instructors = sorted(all_instructors, key=lambda x: x[1], reverse=True)
-            print("\nInstructors ranked by ratings:")
-            for name, avg_rating in sorted_instructors:
-                print(f"{name}: {avg_rating:.2f}/5")
+            leaderboard = store.instructor_ratings
+            print(f"\nTop instructors by rating ({len(leaderboard)} rated):")
+            for position, stats in enumerate(leaderboard.top(10), start=1):
+                print(f"{position}. {stats.name}: {stats.average:.2f}/5 ({stats.count} ratings)")
+            lookup = input("Enter an instructor's name to see their rank (or press Enter to skip): ").strip()
+            if lookup:
+                rank = leaderboard.rank(lookup)
+                if rank is None:
+                    print(f"Instructor '{lookup}' has no ratings.")
+                else:
+                    stats = leaderboard.get(lookup)
+                    histogram = ", ".join(f"{r}*: {c}" for r, c in enumerate(stats.histogram, start=1))
+                    print(f"{lookup} is ranked #{rank} of {len(leaderboard)} "
+                          f"with {stats.average:.2f}/5 ({histogram}).")
+                    events = store.event_ratings.get(lookup)
+                    if events is not None:
+                        print(f"Their rated events average {events.average:.2f}/5 over {events.count} ratings.")
 
         elif choice == "16":
-            save_data(event_list)
+            try:
+                journal.snapshot(store)
+            except ValueError as error:  # Every change is still in the journal and replays on the next start
+                print(f"Snapshot skipped: {error}.")
+            journal.close()
+            notifier.close()
             print("Data saved. Exiting the system. Goodbye!")
-            log_action("System exited and data saved.")
+            log_action("exit")
+            audit_log.close()
             break
 
+        elif choice == "17":
+            if not metrics.enabled:
+                print("Instrumentation is disabled. Set EVENTFLOW_METRICS=1 to record call counts and latencies.")
+            path = input("Enter the metrics file (.prom for Prometheus text, .json for JSON): ") or "metrics.prom"
+            metrics.dump(path)
+            print(f"Metrics written to {path}.")
+
+        elif choice == "18":
+            participant_name = input("Enter the participant's name: ")
+            start = input("From date (YYYY-MM-DD, or press Enter for all): ").strip() or None
+            end = input("To date (YYYY-MM-DD, or press Enter for all): ").strip() or None
+            if (start and not validate_date(start)) or (end and not validate_date(end)):
+                print("Invalid date format. Please use YYYY-MM-DD.")
+            else:
+                schedule = store.schedule_of(participant_name, start, end)
+                if not schedule:
+                    print(f"No events found for '{participant_name}'.")
+                for event in schedule:
+                    clashes = store.schedules.conflicts(participant_name, event)
+                    note = f" (double-booked with {', '.join(e.name for e in clashes)})" if clashes else ""
+                    print(f"{event.date} - {event.name} [{event.state}]{note}")
+
+        elif choice == "19":
+            try:
+                workers = int(input("Number of workers (default 4): ") or 4)
+                cap = input("Max concurrent events per instructor (press Enter for no limit): ").strip()
+                per_instructor = int(cap) if cap else None
+                if workers < 1 or (per_instructor is not None and per_instructor < 1):
+                    raise ValueError
+            except ValueError:
+                print("Please enter positive integers.")
+            else:
+                def execute(event):
+                    participants_list = list(event.participants)
+                    if participants_list:
+                        notifier.notify(event.name, participants_list, f"Event '{event.name}' is now ongoing.")
+
+                report = run_ready(store, execute, workers=workers, per_instructor=per_instructor)
+                for event in report.completed:
+                    print(f"Event '{event.name}' completed successfully.")
+                for event, error in report.failed:
+                    print(f"Event '{event.name}' failed: {error}")
+                print(f"Executed {len(report.completed)} events on {workers} workers in {report.makespan:.3f}s "
+                      f"(average parallelism {report.parallelism:.2f}, peak {report.peak}).")
+                if len(store.scheduler):
+                    print(f"{len(store.scheduler)} events are still waiting on failed dependencies.")
+                log_action("execute_batch", executed=len(report.completed), failed=len(report.failed),
+                           workers=workers, makespan=report.makespan)
+
+        metrics.finish("menu." + MENU_ACTIONS.get(choice, "invalid"), started)
+
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "serve":
+        from server import cli
+        sys.exit(cli(sys.argv[2:]))
+    if len(sys.argv) > 1:
+        from bulk import cli
+        sys.exit(cli(sys.argv[1:]))
     main()
@@ -0,0 +1,198 @@
+import bisect
+import functools
+import json
+import time
+
+from heap import MinHeap
+from hash_table import HashTable
+from tree import EventTree
+from graph import DirectedGraph
+from store import EventStore
+
+# مرزهای هیستوگرام تأخیر (ثانیه)
+BUCKETS = (1e-6, 5e-6, 1e-5, 5e-5, 1e-4, 5e-4, 1e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+INSTRUMENTED = {
+    MinHeap: ("insert", "extract_min", "peek", "remove", "update_priority", "heapify"),
+    HashTable: ("insert", "get", "delete", "__contains__"),
+    EventTree: ("insert", "remove", "bulk_load", "inorder_by_date", "inorder_by_participants",
+                "inorder_by_instructor", "inorder_by_status", "inorder_by_rating", "page", "events_on",
+                "events_by_instructor"),
+    DirectedGraph: ("add_event", "remove_event", "add_dependency", "remove_dependency",
+                    "has_cycle", "topological_order", "bulk_load"),
+    EventStore: ("add", "remove", "get", "update_state", "add_dependency", "remove_dependency",
+                 "add_participant", "rate_event", "rate_instructor", "by_state", "pending_dependencies"),
+}
+
+enabled = False
+_originals = {}  # (کلاس، نام متد) -> تابع اصلی
+_histograms = {}  # نام عملیات -> Histogram
+_gauges = {}  # نام سنجه -> تابع بدون آرگومان
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        """هیستوگرام تأخیر با مرزهای ثابت BUCKETS"""
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """تخمین چندک از روی مرز بالای سطل‌ها"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return BUCKETS[index] if index < len(BUCKETS) else float("inf")
+        return float("inf")
+
+
+def observe(name, seconds):
+    """ثبت یک فراخوانی و مدت آن"""
+    histogram = _histograms.get(name)
+    if histogram is None:
+        histogram = _histograms[name] = Histogram()
+    histogram.observe(seconds)
+
+
+def _wrap(name, function):
+    perf_counter = time.perf_counter
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            observe(name, perf_counter() - start)
+    return wrapper
+
+
+def enable():
+    """
+    فعال‌سازی ابزار دقیق: متدهای ساختارهای داده با نسخه‌ی زمان‌سنج جایگزین می‌شوند.
+    در حالت غیرفعال متدهای اصلی دست‌نخورده‌اند و هزینه‌ای اضافه نمی‌شود.
+    """
+    global enabled
+    if enabled:
+        return
+    for cls, methods in INSTRUMENTED.items():
+        for method in methods:
+            original = cls.__dict__[method]
+            _originals[(cls, method)] = original
+            name = f"{cls.__name__}.{method}"
+            if isinstance(original, classmethod):
+                setattr(cls, method, classmethod(_wrap(name, original.__func__)))
+            else:
+                setattr(cls, method, _wrap(name, original))
+    enabled = True
+
+
+def disable():
+    """بازگرداندن متدهای اصلی"""
+    global enabled
+    for (cls, method), original in _originals.items():
+        setattr(cls, method, original)
+    _originals.clear()
+    enabled = False
+
+
+def reset():
+    _histograms.clear()
+
+
+def start():
+    """شروع زمان‌سنجی یک عملیات منو؛ در حالت غیرفعال None برمی‌گرداند"""
+    return time.perf_counter() if enabled else None
+
+
+def finish(name, started):
+    """پایان زمان‌سنجی عملیاتی که با start() شروع شده است"""
+    if started is not None:
+        observe(name, time.perf_counter() - started)
+
+
+def register_gauge(name, function):
+    """ثبت سنجه‌ای که هنگام خروجی گرفتن محاسبه می‌شود"""
+    _gauges[name] = function
+
+
+def _tree_height(store, view):
+    tree = store._tree
+    return getattr(tree, view).height if tree is not None else 0
+
+
+def watch_store(store):
+    """
+    ثبت سنجه‌های ساختاری مخزن: اندازه‌ی صف، ارتفاع درخت‌ها، طول جست‌وجوی جدول و یال‌های گراف
+    شاخص‌های تنبل تا وقتی ساخته نشده‌اند ۰ گزارش می‌شوند؛ خواندن سنجه نباید آن‌ها را بسازد.
+    """
+    register_gauge("events", lambda: len(store))
+    register_gauge("heap_size", lambda: len(store.heap))
+    register_gauge("ready_queue_size", lambda: len(store.scheduler.ready))
+    register_gauge("tree_height_date", lambda: _tree_height(store, "by_date"))
+    register_gauge("tree_height_participants", lambda: _tree_height(store, "by_participants"))
+    register_gauge("tree_height_instructor", lambda: _tree_height(store, "by_instructor"))
+    register_gauge("hash_table_capacity", lambda: store.events.size)
+    register_gauge("hash_table_max_probe_length", lambda: max(store.events.probe_lengths(), default=0))
+    register_gauge("graph_nodes", lambda: len(store.graph.graph))
+    register_gauge("graph_edges", lambda: store.graph.edge_count())
+    register_gauge("participants", lambda: len(store._schedules) if store._schedules is not None else 0)
+
+
+def snapshot():
+    """وضعیت فعلی همه‌ی سنجه‌ها به صورت دیکشنری"""
+    operations = {}
+    for name, histogram in sorted(_histograms.items()):
+        operations[name] = {
+            "calls": histogram.count,
+            "total_seconds": histogram.total,
+            "mean_seconds": histogram.total / histogram.count if histogram.count else 0.0,
+            "p50_seconds": histogram.quantile(0.5),
+            "p99_seconds": histogram.quantile(0.99),
+            "buckets": {str(bound): count for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts)},
+        }
+    gauges = {name: function() for name, function in sorted(_gauges.items())}
+    return {"enabled": enabled, "operations": operations, "gauges": gauges}
+
+
+def to_prometheus():
+    """خروجی سنجه‌ها در قالب متنی Prometheus"""
+    lines = [
+        "# HELP eventflow_calls_total Number of instrumented calls.",
+        "# TYPE eventflow_calls_total counter",
+    ]
+    for name, histogram in sorted(_histograms.items()):
+        lines.append(f'eventflow_calls_total{{op="{name}"}} {histogram.count}')
+    lines.append("# HELP eventflow_latency_seconds Latency of instrumented calls.")
+    lines.append("# TYPE eventflow_latency_seconds histogram")
+    for name, histogram in sorted(_histograms.items()):
+        cumulative = 0
+        for bound, count in zip(BUCKETS + ("+Inf",), histogram.counts):
+            cumulative += count
+            lines.append(f'eventflow_latency_seconds_bucket{{op="{name}",le="{bound}"}} {cumulative}')
+        lines.append(f'eventflow_latency_seconds_sum{{op="{name}"}} {histogram.total}')
+        lines.append(f'eventflow_latency_seconds_count{{op="{name}"}} {histogram.count}')
+    for name, function in sorted(_gauges.items()):
+        lines.append(f"# TYPE eventflow_{name} gauge")
+        lines.append(f"eventflow_{name} {function()}")
+    return "\n".join(lines) + "\n"
+
+
+def dump(path):
+    """نوشتن سنجه‌ها در فایل؛ پسوند .json قالب JSON و بقیه قالب Prometheus"""
+    with open(path, "w", encoding="utf-8") as file:
+        if path.endswith(".json"):
+            json.dump(snapshot(), file, indent=2)
+        else:
+            file.write(to_prometheus())
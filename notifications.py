@@ -0,0 +1,240 @@
+import atexit
+import json
+import queue
+import threading
+import time
+from datetime import datetime
+
+_STOP = object()
+
+QUEUED = "queued"
+SENT = "sent"
+RETRYING = "retrying"
+FAILED = "failed"
+
+
+class Notification:
+    __slots__ = ("event", "participant", "message", "sink", "state", "attempts", "error")
+
+    def __init__(self, event, participant, message, sink):
+        """
+        یک اعلان برای یک شرکت‌کننده از طریق یک مقصد
+        :param sink: نام مقصد ارسال
+        """
+        self.event = event
+        self.participant = participant
+        self.message = message
+        self.sink = sink
+        self.state = QUEUED
+        self.attempts = 0
+        self.error = None
+
+    def to_dict(self):
+        return {"event": self.event, "participant": self.participant, "message": self.message}
+
+
+class MemorySink:
+    def __init__(self, name="memory", fail_first=0):
+        """
+        مقصد درون‌حافظه برای آزمایش بدون شبکه
+        :param fail_first: تعداد دسته‌های اول که عمداً ناموفق می‌شوند (برای آزمودن تلاش مجدد)
+        """
+        self.name = name
+        self.fail_first = fail_first
+        self.delivered = []
+        self.batches = 0
+        self._lock = threading.Lock()
+
+    def send(self, batch):
+        with self._lock:
+            self.batches += 1
+            if self.fail_first > 0:
+                self.fail_first -= 1
+                raise ConnectionError("simulated delivery failure")
+            self.delivered.extend(batch)
+
+
+class FileSink:
+    def __init__(self, filename="notifications.jsonl", name="file"):
+        """مقصد محلی که هر دسته را به صورت JSON lines به انتهای فایل اضافه می‌کند"""
+        self.name = name
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def send(self, batch):
+        now = datetime.now().isoformat()
+        lines = "".join(json.dumps(dict(item.to_dict(), ts=now), ensure_ascii=False) + "\n" for item in batch)
+        with self._lock, open(self.filename, "a", encoding="utf-8") as file:
+            file.write(lines)
+
+
+class NotificationDispatcher:
+    def __init__(self, sinks, workers=4, queue_size=10000, batch_size=100,
+                 max_retries=3, backoff=0.5):
+        """
+        ارسال ناهم‌زمان و دسته‌ای اعلان‌ها با چند نخ کارگر برای هر مقصد
+        هر مقصد صف محدود خودش را دارد؛ وقتی صف پر است notify منتظر می‌ماند (فشار معکوس).
+        مقصد باید متد send(batch) داشته باشد: استثنا یعنی شکست کل دسته
+        و بازگرداندن لیستی از اعلان‌ها یعنی شکست همان اعلان‌ها.
+        :param workers: تعداد نخ‌های کارگر هر مقصد
+        :param batch_size: حداکثر تعداد اعلان در هر فراخوانی send
+        :param max_retries: تعداد تلاش‌های مجدد پیش از ثبت شکست
+        :param backoff: تأخیر پایه‌ی تلاش مجدد (ثانیه)؛ در هر تلاش دو برابر می‌شود
+        """
+        self.sinks = list(sinks)
+        self.workers = workers
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._queues = {sink.name: queue.Queue(maxsize=queue_size) for sink in self.sinks}
+        self._status = {}  # نام رویداد -> {شرکت‌کننده: {نام مقصد: Notification}}، فقط اعلان‌های در جریان
+        self._settled = {}  # نام رویداد -> {SENT: تعداد، FAILED: تعداد}
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def _start(self):
+        with self._lock:
+            if self._threads:
+                return
+            for sink in self.sinks:
+                for index in range(self.workers):
+                    thread = threading.Thread(target=self._run, args=(sink, self._queues[sink.name]),
+                                              name=f"notify-{sink.name}-{index}", daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+            atexit.register(self.close)
+
+    def notify(self, event, participants, message, timeout=None):
+        """
+        صف کردن اعلان برای همه‌ی شرکت‌کنندگان یک رویداد در همه‌ی مقصدها
+        :param timeout: حداکثر انتظار برای جا باز شدن در صف پر؛ None یعنی انتظار نامحدود
+        :raises queue.Full: اگر پیش از پایان timeout جایی باز نشود
+        :return: تعداد اعلان‌های صف‌شده
+        """
+        if not self._threads:
+            self._start()
+        count = 0
+        for participant in participants:
+            for sink in self.sinks:
+                item = Notification(event, participant, message, sink.name)
+                with self._lock:
+                    self._status.setdefault(event, {}).setdefault(participant, {})[sink.name] = item
+                self._queues[sink.name].put(item, timeout=timeout)
+                count += 1
+        return count
+
+    def _run(self, sink, jobs):
+        while True:
+            item = jobs.get()
+            if item is _STOP:
+                jobs.task_done()
+                return
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    jobs.put(item)  # برای پایان دادن به همین نخ پس از این دسته
+                    jobs.task_done()
+                    break
+                batch.append(item)
+            self._deliver(sink, batch)
+            for _ in batch:
+                jobs.task_done()
+
+    def _deliver(self, sink, batch):
+        """ارسال یک دسته با تلاش مجدد نمایی برای اعلان‌های ناموفق"""
+        attempt = 0
+        while batch:
+            for item in batch:
+                item.attempts += 1
+            try:
+                failed = sink.send(batch) or []
+                error = "rejected by sink"
+            except Exception as exc:
+                failed = batch
+                error = f"{type(exc).__name__}: {exc}"
+            failed_ids = {id(item) for item in failed}
+            self._settle([item for item in batch if id(item) not in failed_ids], SENT)
+            if not failed:
+                return
+            if attempt >= self.max_retries:
+                self._settle(failed, FAILED, error)
+                return
+            for item in failed:
+                item.state = RETRYING
+                item.error = error
+            time.sleep(self.backoff * 2 ** attempt)
+            attempt += 1
+            batch = list(failed)
+
+    def _settle(self, items, state, error=None):
+        """
+        ثبت نتیجه‌ی نهایی اعلان‌ها: فقط شمارنده‌ی رویداد نگه داشته می‌شود و خود اعلان رها می‌شود
+        تا حافظه‌ی یک فرایند طولانی با تعداد اعلان‌های ارسال‌شده رشد نکند.
+        """
+        with self._lock:
+            for item in items:
+                item.state = state
+                item.error = error
+                counts = self._settled.get(item.event)
+                if counts is None:
+                    counts = self._settled[item.event] = {SENT: 0, FAILED: 0}
+                counts[state] += 1
+                participants = self._status.get(item.event)
+                deliveries = participants.get(item.participant) if participants else None
+                if deliveries is None or deliveries.get(item.sink) is not item:
+                    continue  # اعلان جدیدتری برای همین شرکت‌کننده و مقصد جای آن را گرفته است
+                del deliveries[item.sink]
+                if not deliveries:
+                    del participants[item.participant]
+                    if not participants:
+                        del self._status[item.event]
+
+    def status(self, event):
+        """
+        وضعیت اعلان‌های در جریان یک رویداد: {شرکت‌کننده: {مقصد: وضعیت}}
+        اعلان‌های ارسال‌شده یا ناموفق فقط در summary شمرده می‌شوند.
+        """
+        with self._lock:
+            participants = dict(self._status.get(event, {}))
+        return {participant: {sink: item.state for sink, item in deliveries.items()}
+                for participant, deliveries in participants.items()}
+
+    def summary(self, event=None):
+        """شمارش اعلان‌ها بر اساس وضعیت، برای یک رویداد یا همه‌ی رویدادها"""
+        with self._lock:
+            if event is not None:
+                events = [self._status.get(event, {})]
+                settled = [self._settled.get(event, {})]
+            else:
+                events = list(self._status.values())
+                settled = list(self._settled.values())
+            counts = {QUEUED: 0, RETRYING: 0, SENT: 0, FAILED: 0}
+            for totals in settled:
+                for state, count in totals.items():
+                    counts[state] += count
+            for participants in events:
+                for deliveries in participants.values():
+                    for item in deliveries.values():
+                        counts[item.state] += 1
+        return counts
+
+    def join(self):
+        """انتظار تا پایان پردازش همه‌ی اعلان‌های صف‌شده"""
+        for jobs in self._queues.values():
+            jobs.join()
+
+    def close(self):
+        """ارسال اعلان‌های باقی‌مانده و توقف نخ‌های کارگر"""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        if not threads:
+            return
+        for sink in self.sinks:
+            for _ in range(self.workers):
+                self._queues[sink.name].put(_STOP)
+        for thread in threads:
+            thread.join()
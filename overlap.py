@@ -0,0 +1,81 @@
+import heapq
+
+
+def interval(event):
+    """
+    بازه‌ی زمانی بسته‌ی رویداد بر حسب ordinal روز
+    رویدادها فعلاً تک‌روزه‌اند، پس بازه از همان روز شروع و به همان روز ختم می‌شود.
+    شاخص‌های هم‌پوشانی و برنامه‌ها فقط از این تابع بازه را می‌گیرند؛ رویداد چندروزه باید همین‌جا اضافه شود.
+    """
+    return event.ordinal, event.ordinal
+
+
+class OverlapIndex:
+    def __init__(self):
+        """شاخص هم‌پوشانی رویدادها با سطل‌بندی روزانه"""
+        self._buckets = {}  # شماره‌ی روز -> {نام: رویداد}
+        self._spans = {}  # نام رویداد -> (روز شروع، روز پایان)
+        self._events = {}  # نام رویداد -> رویداد
+
+    def __len__(self):
+        return len(self._spans)
+
+    def add(self, event):
+        """افزودن رویداد به سطل همه‌ی روزهایی که در بر می‌گیرد"""
+        if event.name in self._spans:
+            self.remove(event.name)
+        span = interval(event)
+        self._spans[event.name] = span
+        self._events[event.name] = event
+        for day in range(span[0], span[1] + 1):
+            bucket = self._buckets.get(day)
+            if bucket is None:
+                bucket = self._buckets[day] = {}
+            bucket[event.name] = event
+
+    def remove(self, name):
+        span = self._spans.pop(name, None)
+        if span is None:
+            return False
+        del self._events[name]
+        for day in range(span[0], span[1] + 1):
+            bucket = self._buckets[day]
+            del bucket[name]
+            if not bucket:
+                del self._buckets[day]
+        return True
+
+    def conflicts_with(self, event):
+        """
+        رویدادهایی که با event هم‌پوشانی دارند، بدون پیمایش همه‌ی رویدادها
+        هزینه متناسب با تعداد روزهای بازه و رویدادهای همان روزهاست.
+        """
+        start, end = interval(event)
+        found = {}
+        for day in range(start, end + 1):
+            for name, other in self._buckets.get(day, {}).items():
+                if name == event.name or name in found:
+                    continue
+                other_start, other_end = interval(other)
+                if other_start <= end and start <= other_end:
+                    found[name] = other
+        return list(found.values())
+
+    def conflicts(self, events=None):
+        """
+        همه‌ی جفت‌های هم‌پوشان با الگوریتم خط جاروب در زمان O(n log n + k)
+        :param events: رویدادهای مورد بررسی؛ پیش‌فرض همه‌ی رویدادهای شاخص
+        """
+        if events is None:
+            events = self._events.values()
+        ordered = sorted(((interval(event), index, event) for index, event in enumerate(events)),
+                         key=lambda item: (item[0][0], item[1]))
+        active = []  # (پایان، ترتیب، رویداد)
+        pairs = []
+        for (start, end), index, event in ordered:
+            while active and active[0][0] < start:
+                heapq.heappop(active)
+            for _, _, other in active:
+                pairs.append((other, event))
+            heapq.heappush(active, (end, index, event))
+        return pairs
@@ -0,0 +1,108 @@
+from bisect import bisect_left, bisect_right
+
+from overlap import interval
+
+
+class ParticipantIndex:
+    def __init__(self):
+        """
+        شاخص معکوس شرکت‌کننده -> رویدادها
+        افزودن و حذف O(1) است؛ برنامه‌ی مرتب هر شرکت‌کننده فقط هنگام پرس‌وجو و فقط پس از تغییر دوباره ساخته می‌شود.
+        """
+        self._events = {}  # شرکت‌کننده -> {نام رویداد: رویداد}
+        self._days = {}  # شرکت‌کننده -> {شماره‌ی روز: {نام رویداد: رویداد}}
+        self._sorted = {}  # شرکت‌کننده -> لیست مرتب (شروع، پایان، نام، رویداد)؛ کش
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, participant):
+        return participant in self._events
+
+    def add(self, participant, event):
+        """ثبت رویداد در برنامه‌ی شرکت‌کننده"""
+        events = self._events.get(participant)
+        if events is None:
+            events = self._events[participant] = {}
+            self._days[participant] = {}
+        if event.name in events:
+            return False
+        events[event.name] = event
+        days = self._days[participant]
+        start, end = interval(event)
+        for day in range(start, end + 1):
+            bucket = days.get(day)
+            if bucket is None:
+                bucket = days[day] = {}
+            bucket[event.name] = event
+        self._sorted.pop(participant, None)
+        return True
+
+    def add_event(self, event):
+        """ثبت رویداد برای همه‌ی شرکت‌کنندگانش"""
+        for participant in event.participants:
+            self.add(participant, event)
+
+    def remove(self, participant, name):
+        """حذف رویداد از برنامه‌ی شرکت‌کننده"""
+        events = self._events.get(participant)
+        if events is None or name not in events:
+            return False
+        event = events.pop(name)
+        days = self._days[participant]
+        start, end = interval(event)
+        for day in range(start, end + 1):
+            bucket = days[day]
+            del bucket[name]
+            if not bucket:
+                del days[day]
+        if not events:
+            del self._events[participant]
+            del self._days[participant]
+        self._sorted.pop(participant, None)
+        return True
+
+    def remove_event(self, event):
+        """حذف رویداد از برنامه‌ی همه‌ی شرکت‌کنندگانش"""
+        for participant in event.participants:
+            self.remove(participant, event.name)
+
+    def events_of(self, participant):
+        """رویدادهای شرکت‌کننده به ترتیب تاریخ"""
+        return [item[3] for item in self._schedule(participant)]
+
+    def events_between(self, participant, start, end):
+        """رویدادهای شرکت‌کننده که شروعشان بین دو ordinal (شامل هر دو) است"""
+        schedule = self._schedule(participant)
+        low = bisect_left(schedule, (start,))
+        high = bisect_right(schedule, (end, float("inf")))
+        return [item[3] for item in schedule[low:high]]
+
+    def booked_on(self, participant, day):
+        """رویدادهای شرکت‌کننده در یک روز (ordinal)"""
+        return list(self._days.get(participant, {}).get(day, {}).values())
+
+    def conflicts(self, participant, event):
+        """
+        رویدادهای دیگر شرکت‌کننده که با event هم‌پوشانی دارند
+        فقط روزهای بازه‌ی event بررسی می‌شوند، نه همه‌ی رویدادها.
+        """
+        days = self._days.get(participant)
+        if not days:
+            return []
+        start, end = interval(event)
+        found = {}
+        for day in range(start, end + 1):
+            for name, other in days.get(day, {}).items():
+                if name != event.name:
+                    found[name] = other
+        return list(found.values())
+
+    def _schedule(self, participant):
+        schedule = self._sorted.get(participant)
+        if schedule is None:
+            schedule = sorted(interval(event) + (name, event)
+                              for name, event in self._events.get(participant, {}).items())
+            if participant in self._events:
+                self._sorted[participant] = schedule
+        return schedule
@@ -0,0 +1,114 @@
+from itertools import islice
+
+from hash_table import HashTable
+from tree import BalancedIndex
+
+
+def _check(rating):
+    if not isinstance(rating, int) or not 1 <= rating <= 5:
+        raise ValueError(f"Invalid rating {rating!r}. Expected an integer between 1 and 5.")
+
+
+class RatingStats:
+    __slots__ = ("name", "count", "total", "histogram")
+
+    def __init__(self, name):
+        """
+        آمار تجمعی امتیازهای یک مدرس
+        :param name: نام مدرس
+        """
+        self.name = name
+        self.count = 0
+        self.total = 0
+        self.histogram = [0] * 5  # تعداد امتیازهای ۱ تا ۵
+
+    @property
+    def average(self):
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, rating):
+        self.count += 1
+        self.total += rating
+        self.histogram[rating - 1] += 1
+
+    def discard(self, rating):
+        self.count -= 1
+        self.total -= rating
+        self.histogram[rating - 1] -= 1
+
+    def to_dict(self):
+        return {"count": self.count, "total": self.total, "histogram": list(self.histogram)}
+
+
+class Leaderboard:
+    def __init__(self):
+        """
+        امتیازهای مدرسان با آمار تجمعی و رده‌بندی همیشه مرتب
+        «k مدرس برتر» و «رتبه‌ی مدرس» در زمان O(log n + k) پاسخ داده می‌شوند.
+        """
+        self.stats = HashTable()  # نام مدرس -> RatingStats
+        self._ranking = BalancedIndex(key=lambda stats: (-stats.average, stats.name))
+
+    def __len__(self):
+        return len(self._ranking)
+
+    def __contains__(self, name):
+        return name in self._ranking
+
+    def get(self, name):
+        """آمار یک مدرس یا None"""
+        return self.stats.get(name)
+
+    def add(self, name, rating):
+        """ثبت یک امتیاز (۱ تا ۵) برای مدرس"""
+        _check(rating)  # پیش از هر تغییری، تا آمار نیمه‌کاره نماند
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = RatingStats(name)
+            self.stats.insert(name, stats)
+        stats.add(rating)
+        self._ranking.insert(stats)  # کلید جدید جایگزین کلید قبلی می‌شود
+        return stats
+
+    def discard(self, name, rating):
+        """حذف یک امتیاز ثبت‌شده"""
+        _check(rating)
+        stats = self.stats.get(name)
+        if stats is None or not stats.histogram[rating - 1]:
+            return False
+        stats.discard(rating)
+        if stats.count:
+            self._ranking.insert(stats)
+        else:
+            self._ranking.remove(name)
+            self.stats.delete(name)
+        return True
+
+    def restore(self, name, histogram):
+        """بازسازی آمار یک مدرس از هیستوگرام ذخیره‌شده"""
+        stats = RatingStats(name)
+        for rating, count in enumerate(histogram, start=1):
+            stats.histogram[rating - 1] = count
+            stats.count += count
+            stats.total += rating * count
+        if not stats.count:
+            return None
+        self.stats.insert(name, stats)
+        self._ranking.insert(stats)
+        return stats
+
+    def top(self, k):
+        """k مدرس برتر به ترتیب میانگین نزولی"""
+        return list(islice(self._ranking, k))
+
+    def ranked(self, offset=0):
+        """پیمایش تنبل رده‌بندی از جایگاه offset"""
+        return self._ranking.iter_from(offset)
+
+    def rank(self, name):
+        """رتبه‌ی مدرس (از ۱) یا None"""
+        position = self._ranking.rank_of(name)
+        return position + 1 if position is not None else None
+
+    def to_dict(self):
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
@@ -0,0 +1,101 @@
+from heap import MinHeap
+
+
+class Scheduler:
+    def __init__(self, graph):
+        """
+        زمان‌بند آگاه از وابستگی‌ها: فقط رویدادهای آماده در صف اولویت قرار می‌گیرند
+        :param graph: گراف وابستگی‌ها (DirectedGraph)
+        """
+        self.graph = graph
+        self.ready = MinHeap()  # رویدادهای بدون پیش‌نیاز ناتمام
+        self._unmet = {}  # نام رویداد اجرانشده -> تعداد پیش‌نیازهای ناتمام
+        self._events = {}  # نام رویداد اجرانشده -> رویداد
+
+    @classmethod
+    def build(cls, graph, events):
+        """ساخت زمان‌بند از رویدادهای اجرانشده؛ صف آماده یک‌جا ساخته می‌شود"""
+        scheduler = cls(graph)
+        for event in events:
+            scheduler._events[event.name] = event
+        pending = scheduler._events
+        ready = []
+        for name, event in pending.items():
+            count = sum(1 for prerequisite in graph.graph.get(name, ()) if prerequisite in pending)
+            scheduler._unmet[name] = count
+            if count == 0:
+                ready.append(event)
+        scheduler.ready = MinHeap.heapify(ready)
+        return scheduler
+
+    def __len__(self):
+        return len(self._events)
+
+    def __contains__(self, name):
+        return name in self._events
+
+    def unmet(self, name):
+        """تعداد پیش‌نیازهای ناتمام یک رویداد"""
+        return self._unmet.get(name, 0)
+
+    def peek(self):
+        """رویداد آماده با بالاترین اولویت در زمان O(1)"""
+        return self.ready.peek()
+
+    def pop(self):
+        """برداشتن رویداد آماده با بالاترین اولویت در زمان O(log n)"""
+        return self.ready.extract_min()
+
+    def blocked_count(self):
+        return len(self._events) - len(self.ready)
+
+    def add(self, event):
+        """ثبت رویداد اجرانشده (جدید یا بازگشته از حالت تکمیل)"""
+        name = event.name
+        if name in self._events:
+            return
+        self._events[name] = event
+        self._unmet[name] = 0
+        for prerequisite in self.graph.graph.get(name, ()):
+            if prerequisite in self._events:
+                self._unmet[name] += 1
+        for dependent in self.graph.reverse.get(name, ()):
+            self._block(dependent)
+        if self._unmet[name] == 0:
+            self.ready.insert(event)
+
+    def remove(self, name):
+        """حذف رویداد؛ باید پیش از حذف آن از گراف فراخوانی شود"""
+        if name not in self._events:
+            return
+        del self._events[name]
+        del self._unmet[name]
+        self.ready.remove(name)
+        for dependent in self.graph.reverse.get(name, ()):
+            self._unblock(dependent)
+
+    def complete(self, name):
+        """ثبت اتمام رویداد و آزاد کردن وابسته‌ها در زمان O(درجه‌ی خروجی)"""
+        self.remove(name)
+
+    def dependency_added(self, dependent, prerequisite):
+        """به‌روزرسانی شمارنده پس از افزودن یال جدید به گراف"""
+        if prerequisite in self._events:
+            self._block(dependent)
+
+    def dependency_removed(self, dependent, prerequisite):
+        """به‌روزرسانی شمارنده پس از حذف یال از گراف"""
+        if prerequisite in self._events:
+            self._unblock(dependent)
+
+    def _block(self, name):
+        if name in self._events:
+            if self._unmet[name] == 0:
+                self.ready.remove(name)
+            self._unmet[name] += 1
+
+    def _unblock(self, name):
+        if name in self._events:
+            self._unmet[name] -= 1
+            if self._unmet[name] == 0:
+                self.ready.insert(self._events[name])
@@ -0,0 +1,340 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+from event import Event, VALID_STATES, to_ordinal, to_priority
+from journal import Journal
+
+MAX_LINE = 1 << 20  # حداکثر طول یک درخواست (بایت)
+
+
+class ReadWriteLock:
+    def __init__(self):
+        """
+        قفل خواننده-نویسنده برای asyncio با اولویت نویسنده
+        چند خواننده هم‌زمان وارد می‌شوند؛ نویسنده انحصاری است و خواننده‌های جدید پشت نویسنده‌ی منتظر می‌مانند.
+        """
+        self._condition = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+
+    @contextlib.asynccontextmanager
+    async def read(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: not self._writer and not self._waiting_writers)
+            self._readers += 1
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextlib.asynccontextmanager
+    async def write(self):
+        async with self._condition:
+            self._waiting_writers += 1
+            try:
+                await self._condition.wait_for(lambda: not self._writer and not self._readers)
+            finally:
+                self._waiting_writers -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            async with self._condition:
+                self._writer = False
+                self._condition.notify_all()
+
+
+def _event(store, args):
+    event = store.get(args["name"])
+    if event is None:
+        raise LookupError(f"event '{args['name']}' not found")
+    return event
+
+
+def _rating(args):
+    rating = args["rating"]
+    if isinstance(rating, bool) or not isinstance(rating, int) or not 1 <= rating <= 5:
+        raise ValueError("rating must be an integer between 1 and 5")
+    return rating
+
+
+def _text(args, field):
+    # هر مقدار غیررشته‌ای در مخزن مشترک می‌ماند و عکس‌فوری و نماهای مرتب را برای همه خراب می‌کند
+    value = args[field]
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string")
+    return value
+
+
+def _names(events):
+    return [event.name for event in events]
+
+
+# --- عملیات نوشتنی: با قفل انحصاری اجرا می‌شوند ---
+
+def add_event(store, args):
+    if not isinstance(args["date"], str):
+        raise ValueError("date must be a YYYY-MM-DD string")
+    instructor = args.get("instructor")
+    if instructor is not None and not isinstance(instructor, str):
+        raise ValueError("instructor must be a string")
+    event = Event(_text(args, "name"), to_ordinal(args["date"]), to_priority(args["priority"]), instructor=instructor)
+    if not store.add(event):
+        raise ValueError(f"event '{event.name}' already exists")
+    return {"event": event.to_dict(), "overlaps": _names(store.overlaps.conflicts_with(event))}
+
+
+def remove_event(store, args):
+    if store.remove(args["name"]) is None:
+        raise LookupError(f"event '{args['name']}' not found")
+    return True
+
+
+def execute_next(store, args):
+    event = store.scheduler.peek()
+    if event is None:
+        return None
+    store.update_state(event.name, "Ongoing")
+    store.update_state(event.name, "Completed")
+    return event.to_dict()
+
+
+def update_state(store, args):
+    if args["state"] not in VALID_STATES:
+        raise ValueError(f"invalid state '{args['state']}'")
+    _event(store, args)
+    return store.update_state(args["name"], args["state"])
+
+
+def add_dependency(store, args):
+    dependent, prerequisite = args["dependent"], args["prerequisite"]
+    if dependent not in store or prerequisite not in store:
+        raise LookupError("one or both events not found")
+    if not store.add_dependency(dependent, prerequisite):
+        raise ValueError(f"dependency {dependent} -> {prerequisite} would create a cycle")
+    return True
+
+
+def remove_dependency(store, args):
+    return store.remove_dependency(args["dependent"], args["prerequisite"])
+
+
+def add_participant(store, args):
+    _event(store, args)
+    if not store.add_participant(args["name"], _text(args, "participant")):
+        raise ValueError(f"'{args['participant']}' is already registered for '{args['name']}'")
+    return {"conflicts": _names(store.booking_conflicts(args["name"], args["participant"]))}
+
+
+def rate_event(store, args):
+    event = _event(store, args)
+    if event.state != "Completed":
+        raise ValueError(f"event '{event.name}' is not completed")
+    return store.rate_event(event.name, _rating(args))
+
+
+def rate_instructor(store, args):
+    store.rate_instructor(_text(args, "instructor"), _rating(args))
+    return True
+
+
+# --- عملیات خواندنی: هم‌زمان با یکدیگر اجرا می‌شوند ---
+
+def get_event(store, args):
+    event = _event(store, args)
+    return dict(event.to_dict(), depends_on=store.graph.dependencies(event.name))
+
+
+def next_event(store, args):
+    event = store.heap.peek()
+    return event.to_dict() if event is not None else None
+
+
+def ready_event(store, args):
+    event = store.scheduler.peek()
+    return event.to_dict() if event is not None else None
+
+
+def has_cycle(store, args):
+    return store.graph.has_cycle()
+
+
+def by_state(store, args):
+    return _names(store.by_state(args["state"]))
+
+
+def by_date(store, args):
+    return _names(store.by_date(args["date"]))
+
+
+def by_instructor(store, args):
+    return _names(store.by_instructor(args["instructor"]))
+
+
+def events_between(store, args):
+    return _names(store.tree.events_between(args["start"], args["end"]))
+
+
+def categorize(store, args):
+    """یک صفحه از نمای مرتب: view یکی از date/participants/instructor/status/rating"""
+    tree = store.tree
+    view = args.get("view", "date")
+    offset, limit = int(args.get("offset", 0)), int(args.get("limit", 50))
+    if offset < 0 or limit < 0:
+        raise ValueError("offset and limit must be non-negative")
+    return {"total": len(tree.view(view)), "events": _names(tree.page(view, offset, limit))}
+
+
+def participants(store, args):
+    _event(store, args)
+    return store.participants_of(args["name"])
+
+
+def schedule(store, args):
+    return _names(store.schedule_of(args["participant"], args.get("start"), args.get("end")))
+
+
+def overlaps(store, args):
+    return [[first.name, second.name] for first, second in store.overlaps.conflicts()]
+
+
+def top_instructors(store, args):
+    return [{"name": stats.name, "average": stats.average, "count": stats.count}
+            for stats in store.instructor_ratings.top(int(args.get("k", 10)))]
+
+
+def instructor_rank(store, args):
+    return store.instructor_ratings.rank(args["instructor"])
+
+
+def stats(store, args):
+    return {"events": len(store), "pending": len(store.scheduler), "ready": len(store.scheduler.ready),
+            "dependencies": store.graph.edge_count()}
+
+
+WRITES = {function.__name__: function for function in (
+    add_event, remove_event, execute_next, update_state, add_dependency, remove_dependency,
+    add_participant, rate_event, rate_instructor)}
+READS = {function.__name__: function for function in (
+    get_event, next_event, ready_event, has_cycle, by_state, by_date, by_instructor, events_between,
+    categorize, participants, schedule, overlaps, top_instructors, instructor_rank, stats)}
+
+
+class EventServer:
+    def __init__(self, store, workers=8):
+        """
+        سرور JSON سطری روی asyncio برای چند کاربر هم‌زمان
+        هر سطر یک درخواست {"id", "op", "args"} و هر پاسخ {"id", "ok", "result"|"error"} است.
+        عملیات در مخزن نخ‌ها اجرا می‌شوند تا حلقه‌ی رویداد آزاد بماند؛
+        خواندن‌ها هم‌زمان و نوشتن‌ها پشت قفل انحصاری اجرا می‌شوند.
+        :param store: مخزن مشترک (EventStore)
+        :param workers: تعداد نخ‌های اجرای عملیات
+        """
+        self.store = store
+        self.lock = ReadWriteLock()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="server")
+        self.served = 0
+
+    async def execute(self, op, args):
+        """اجرای یک عملیات با قفل مناسب"""
+        loop = asyncio.get_running_loop()
+        if op in READS:
+            async with self.lock.read():
+                return await loop.run_in_executor(self.pool, READS[op], self.store, args)
+        if op in WRITES:
+            async with self.lock.write():
+                return await loop.run_in_executor(self.pool, WRITES[op], self.store, args)
+        raise ValueError(f"unknown operation '{op}'")
+
+    async def handle(self, reader, writer):
+        """پردازش درخواست‌های یک اتصال به ترتیب دریافت"""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:  # سطر بلندتر از MAX_LINE
+                    writer.write(b'{"id": null, "ok": false, "error": "request too large"}\n')
+                    break
+                if not line:
+                    break
+                response = await self.respond(line)
+                writer.write(json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, line):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            result = await self.execute(request["op"], request.get("args") or {})
+        except KeyError as error:
+            return {"id": request_id, "ok": False, "error": f"missing field {error}"}
+        except (LookupError, ValueError, TypeError) as error:
+            return {"id": request_id, "ok": False, "error": str(error)}
+        except Exception as error:  # خطای پیش‌بینی‌نشده نباید اتصال را قطع کند
+            return {"id": request_id, "ok": False, "error": f"internal error: {type(error).__name__}: {error}"}
+        self.served += 1
+        return {"id": request_id, "ok": True, "result": result}
+
+    async def serve(self, host="127.0.0.1", port=8765, path=None, ready=None):
+        """
+        اجرای سرور تا لغو شدن
+        :param path: مسیر سوکت یونیکس؛ در صورت تعیین به جای TCP استفاده می‌شود
+        :param ready: asyncio.Event که پس از آماده شدن سوکت set می‌شود
+        """
+        if path:
+            server = await asyncio.start_unix_server(self.handle, path=path, limit=MAX_LINE)
+        else:
+            server = await asyncio.start_server(self.handle, host, port, limit=MAX_LINE)
+        if ready is not None:
+            ready.set()
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+
+
+def cli(argv):
+    """ورودی سرور: python main.py serve [--host H] [--port P | --socket PATH]"""
+    parser = argparse.ArgumentParser(prog="main.py serve", description="EventFlow multi-client JSON server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--socket", help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    journal = Journal()
+    store = journal.load()
+    server = EventServer(store, workers=args.workers)
+
+    async def run():
+        task = asyncio.ensure_future(server.serve(args.host, args.port, args.socket))
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            with contextlib.suppress(NotImplementedError):
+                loop.add_signal_handler(signum, task.cancel)
+        print(f"Serving {len(store)} events on {args.socket or f'{args.host}:{args.port}'}")
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.close()
+        journal.snapshot(store)
+        journal.close()
+        print(f"Served {server.served} requests. Data saved.")
+    return 0
@@ -0,0 +1,293 @@
+from heap import MinHeap
+from graph import DirectedGraph
+from hash_table import HashTable
+from tree import EventTree
+from scheduler import Scheduler
+from overlap import OverlapIndex
+from participants import ParticipantIndex
+from ratings import Leaderboard
+from event import to_ordinal
+
+
+class EventStore:
+    def __init__(self):
+        """
+        مخزن مرکزی رویدادها که همه‌ی ساختارهای داده را هماهنگ نگه می‌دارد
+        """
+        self.events = HashTable()  # نام رویداد -> رویداد
+        self.heap = MinHeap()  # صف اولویت رویدادهای اجرانشده
+        self.graph = DirectedGraph()  # وابستگی‌ها
+        self.scheduler = Scheduler(self.graph)  # صف رویدادهای آماده‌ی اجرا
+        self._tree = None  # دسته‌بندی مرتب؛ در اولین استفاده ساخته می‌شود
+        self._overlaps = None  # هم‌پوشانی زمانی رویدادها؛ در اولین استفاده ساخته می‌شود
+        self._schedules = None  # شرکت‌کننده -> رویدادها؛ در اولین استفاده ساخته می‌شود
+        self._by_state = {}  # وضعیت -> {نام: رویداد}
+        self._by_date = {}  # ordinal تاریخ -> {نام: رویداد}
+        self._by_instructor = {}  # مدرس -> {نام: رویداد}
+        self.instructor_ratings = Leaderboard()  # امتیازهای مستقیم مدرسان
+        self.event_ratings = Leaderboard()  # امتیاز رویدادها، تجمیع‌شده برای هر مدرس
+        self.journal = None  # دفتر ثبت تغییرات (Journal) در صورت فعال بودن
+
+    @classmethod
+    def from_events(cls, events, dependencies=()):
+        """
+        ساخت مخزن از لیست رویدادها؛ صف اولویت و زمان‌بند یک‌جا در O(n) ساخته می‌شوند
+        و شاخص‌های ثانویه (درخت‌ها، هم‌پوشانی، برنامه‌ی شرکت‌کنندگان) تا اولین استفاده ساخته نمی‌شوند.
+        :param dependencies: جفت‌های (وابسته، پیش‌نیاز)
+        """
+        store = cls()
+        unique = []
+        for event in events:
+            if event.name in store.events:
+                continue
+            store.events.insert(event.name, event)
+            unique.append(event)
+        store.graph.bulk_load([event.name for event in unique], dependencies)
+        pending = []
+        for event in unique:
+            store._link(store._by_state, event.state, event)
+            store._link(store._by_date, event.ordinal, event)
+            store._link(store._by_instructor, event.instructor, event)
+            if event.rating is not None and event.instructor:
+                store.event_ratings.add(event.instructor, event.rating)
+            if event.state != "Completed":
+                pending.append(event)
+        store.heap = MinHeap.heapify(pending)
+        store.scheduler = Scheduler.build(store.graph, pending)
+        return store
+
+    @property
+    def tree(self):
+        """درخت‌های دسته‌بندی (EventTree)"""
+        if self._tree is None:
+            tree = EventTree()
+            tree.bulk_load(self._in_date_order())
+            self._tree = tree  # فقط شاخص کامل منتشر می‌شود تا خواننده‌های هم‌زمان نیمه‌کاره نبینند
+        return self._tree
+
+    @property
+    def overlaps(self):
+        """شاخص هم‌پوشانی (OverlapIndex)"""
+        if self._overlaps is None:
+            overlaps = OverlapIndex()
+            for event in self._in_date_order():
+                overlaps.add(event)
+            self._overlaps = overlaps
+        return self._overlaps
+
+    @property
+    def schedules(self):
+        """شاخص معکوس شرکت‌کنندگان (ParticipantIndex)"""
+        if self._schedules is None:
+            schedules = ParticipantIndex()
+            for event in self._in_date_order():
+                schedules.add_event(event)
+            self._schedules = schedules
+        return self._schedules
+
+    def _in_date_order(self):
+        """رویدادها به ترتیب تاریخ و در هر روز به ترتیب درج (ترتیب ساخت شاخص‌های تنبل)"""
+        return [event for day in sorted(self._by_date) for event in self._by_date[day].values()]
+
+    def __len__(self):
+        return len(self.events)
+
+    def __contains__(self, name):
+        return name in self.events
+
+    def __iter__(self):
+        return self.events.values()
+
+    def get(self, name):
+        """یافتن رویداد بر اساس نام در زمان O(1)"""
+        return self.events.get(name)
+
+    def add(self, event):
+        """افزودن رویداد به همه‌ی ساختارها؛ نام تکراری پذیرفته نمی‌شود"""
+        if event.name in self.events:
+            return False
+        record = event.to_dict()  # پیش از هر تغییری، تا رویداد نامعتبر مخزن را نیمه‌کاره رها نکند
+        self._index(event)
+        if event.state != "Completed":
+            self.heap.insert(event)
+            self.scheduler.add(event)
+        self._record("add_event", event=record)
+        return True
+
+    def remove(self, name):
+        """حذف رویداد از همه‌ی ساختارها و بازگرداندن آن"""
+        event = self.events.get(name)
+        if event is None:
+            return None
+        self.events.delete(name)
+        self.heap.remove(name)
+        self.scheduler.remove(name)
+        self.graph.remove_event(name)
+        if self._tree is not None:
+            self._tree.remove(name)
+        if self._overlaps is not None:
+            self._overlaps.remove(name)
+        if self._schedules is not None:
+            self._schedules.remove_event(event)
+        self._unlink(self._by_state, event.state, name)
+        self._unlink(self._by_date, event.ordinal, name)
+        self._unlink(self._by_instructor, event.instructor, name)
+        if event.rating is not None and event.instructor:
+            self.event_ratings.discard(event.instructor, event.rating)
+        self._record("remove_event", name=name)
+        return event
+
+    def _index(self, event):
+        self.events.insert(event.name, event)
+        self.graph.add_event(event.name)
+        if self._tree is not None:
+            self._tree.insert(event)
+        if self._overlaps is not None:
+            self._overlaps.add(event)
+        if self._schedules is not None:
+            self._schedules.add_event(event)
+        self._link(self._by_state, event.state, event)
+        self._link(self._by_date, event.ordinal, event)
+        self._link(self._by_instructor, event.instructor, event)
+        if event.rating is not None and event.instructor:
+            self.event_ratings.add(event.instructor, event.rating)
+
+    @staticmethod
+    def _link(index, key, event):
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = {}
+        bucket[event.name] = event
+
+    @staticmethod
+    def _unlink(index, key, name):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(name, None)
+            if not bucket:
+                del index[key]
+
+    def by_state(self, state):
+        """رویدادهای دارای وضعیت مشخص (به ترتیب درج)"""
+        return list(self._by_state.get(state, {}).values())
+
+    def by_date(self, date):
+        """رویدادهای یک تاریخ مشخص"""
+        return list(self._by_date.get(to_ordinal(date), {}).values())
+
+    def by_instructor(self, instructor):
+        """رویدادهای یک مدرس مشخص"""
+        return list(self._by_instructor.get(instructor, {}).values())
+
+    def has_state(self, name, state):
+        """بررسی وضعیت یک رویداد در زمان O(1)"""
+        return name in self._by_state.get(state, {})
+
+    def update_state(self, name, new_state):
+        """تغییر وضعیت رویداد و به‌روزرسانی شاخص‌ها"""
+        event = self.events.get(name)
+        if event is None:
+            return f"Event '{name}' not found."
+        old_state = event.state
+        message = event.update_state(new_state)
+        if event.state != old_state:
+            self._unlink(self._by_state, old_state, name)
+            self._link(self._by_state, event.state, event)
+            if self._tree is not None:
+                self._tree.insert_by_status(event)
+            if event.state == "Completed":
+                self.heap.remove(name)
+                self.scheduler.complete(name)
+            elif old_state == "Completed":
+                self.heap.insert(event)
+                self.scheduler.add(event)
+            self._record("update_state", name=name, state=event.state)
+        return message
+
+    def add_dependency(self, dependent, prerequisite):
+        """ثبت وابستگی: dependent پس از prerequisite اجرا می‌شود؛ وابستگی چرخه‌ساز رد می‌شود"""
+        if prerequisite in self.graph.graph.get(dependent, ()):
+            return True
+        if not self.graph.add_dependency(dependent, prerequisite):
+            return False
+        self.scheduler.dependency_added(dependent, prerequisite)
+        self._record("add_dependency", dependent=dependent, prerequisite=prerequisite)
+        return True
+
+    def remove_dependency(self, dependent, prerequisite):
+        """حذف وابستگی بین دو رویداد"""
+        if not self.graph.remove_dependency(dependent, prerequisite):
+            return False
+        self.scheduler.dependency_removed(dependent, prerequisite)
+        self._record("remove_dependency", dependent=dependent, prerequisite=prerequisite)
+        return True
+
+    def pending_dependencies(self, name):
+        """وابستگی‌هایی از رویداد که هنوز کامل نشده‌اند"""
+        completed = self._by_state.get("Completed", {})
+        return [dep for dep in self.graph.graph.get(name, []) if dep not in completed]
+
+    def add_participant(self, name, participant):
+        """افزودن شرکت‌کننده به رویداد؛ در صورت موفقیت True برمی‌گرداند"""
+        event = self.events.get(name)
+        if event is None or participant in event.participants:
+            return False
+        event.add_participant(participant)
+        if self._tree is not None:
+            self._tree.insert_by_participants(event)
+        if self._schedules is not None:
+            self._schedules.add(participant, event)
+        self._record("add_participant", name=name, participant=participant)
+        return True
+
+    def booking_conflicts(self, name, participant):
+        """رویدادهای دیگر شرکت‌کننده که با رویداد name هم‌پوشانی دارند (رزرو هم‌زمان)"""
+        event = self.events.get(name)
+        return self.schedules.conflicts(participant, event) if event is not None else []
+
+    def schedule_of(self, participant, start=None, end=None):
+        """رویدادهای شرکت‌کننده به ترتیب تاریخ؛ در صورت تعیین بازه فقط همان بازه"""
+        if start is None and end is None:
+            return self.schedules.events_of(participant)
+        start = to_ordinal(start) if start is not None else float("-inf")
+        end = to_ordinal(end) if end is not None else float("inf")
+        return self.schedules.events_between(participant, start, end)
+
+    def participants_of(self, name):
+        """شرکت‌کنندگان یک رویداد به ترتیب ثبت‌نام"""
+        event = self.events.get(name)
+        return list(event.participants) if event is not None else []
+
+    def dependencies(self):
+        """همه‌ی وابستگی‌ها به صورت جفت‌های (وابسته، پیش‌نیاز)"""
+        for dependent, prerequisites in self.graph.graph.items():
+            for prerequisite in prerequisites:
+                yield dependent, prerequisite
+
+    def rate_event(self, name, rating):
+        """امتیازدهی به رویداد و ثبت آن در دفتر تغییرات"""
+        event = self.events.get(name)
+        if event is None:
+            return f"Event '{name}' not found."
+        old_rating = event.rating
+        message = event.rate_event(rating)
+        if event.rating == rating:
+            if event.instructor:
+                if old_rating is not None:
+                    self.event_ratings.discard(event.instructor, old_rating)
+                self.event_ratings.add(event.instructor, rating)
+            if self._tree is not None and old_rating != rating:
+                self._tree.insert_by_rating(event)
+            self._record("rate_event", name=name, rating=rating)
+        return message
+
+    def rate_instructor(self, instructor, rating):
+        """ثبت امتیاز برای یک مدرس؛ میانگین و رتبه‌ی مدرس به صورت افزایشی به‌روز می‌شوند"""
+        self.instructor_ratings.add(instructor, rating)
+        self._record("rate_instructor", instructor=instructor, rating=rating)
+
+    def _record(self, op, **fields):
+        if self.journal is not None:
+            self.journal.append(op, **fields)
+            if self.journal.should_compact():
+                self.journal.snapshot(self)
@@ -1,69 +1,401 @@
+from itertools import islice
+from operator import indexOf
+
+from event import VALID_STATES, to_ordinal
+
+
 class TreeNode:
-    def __init__(self, event):
+    def __init__(self, key, event):
         """
-        گره‌ای که یک رویداد را نگه می‌دارد
-        :param event: شیء رویداد
+        گره‌ای که همه‌ی رویدادهای با کلید یکسان را نگه می‌دارد
+        :param key: کلید مرتب‌سازی گره
+        :param event: اولین رویداد این کلید
         """
-        self.event = event
+        self.key = key
+        self.events = {event.name: event}  # نام رویداد -> رویداد، به ترتیب درج
         self.left = None
         self.right = None
+        self.height = 1
+        self.size = 1  # تعداد رویدادهای زیردرخت (برای رتبه و انتخاب بر اساس جایگاه)
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    node.height = 1 + max(_height(node.left), _height(node.right))
+    node.size = len(node.events) + _size(node.left) + _size(node.right)
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class BalancedIndex:
+    def __init__(self, key):
+        """
+        درخت AVL که رویدادهای با کلید تکراری را در یک گره نگه می‌دارد
+        :param key: تابعی که کلید مرتب‌سازی هر رویداد را برمی‌گرداند
+        """
+        self.key = key
+        self.root = None
+        self._keys = {}  # نام رویداد -> کلیدی که با آن درج شده است
+        self.version = 0  # با هر تغییر افزایش می‌یابد و کش لیست مرتب را باطل می‌کند
+        self._cache = None  # (نسخه، لیست مرتب رویدادها)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return name in self._keys
+
+    @property
+    def height(self):
+        return _height(self.root)
+
+    def bulk_load(self, events):
+        """ساخت درخت متوازن از مجموعه‌ای از رویدادها با یک مرتب‌سازی (جایگزین محتوای قبلی)"""
+        keyed = sorted(((self.key(event), index, event) for index, event in enumerate(events)),
+                       key=lambda item: (item[0], item[1]))
+        self._keys = {}
+        self.version += 1
+        nodes = []
+        for key, _, event in keyed:
+            self._keys[event.name] = key
+            if nodes and not (nodes[-1].key < key):
+                nodes[-1].events[event.name] = event
+            else:
+                nodes.append(TreeNode(key, event))
+        self.root = self._build(nodes, 0, len(nodes))
+
+    def _build(self, nodes, low, high):
+        if low >= high:
+            return None
+        middle = (low + high) // 2
+        node = nodes[middle]
+        node.left = self._build(nodes, low, middle)
+        node.right = self._build(nodes, middle + 1, high)
+        _update(node)
+        return node
+
+    def insert(self, event):
+        """افزودن رویداد؛ اگر از قبل وجود داشته باشد با کلید جدید جابه‌جا می‌شود"""
+        if event.name in self._keys:
+            self.remove(event.name)
+        key = self.key(event)
+        self._keys[event.name] = key
+        self.version += 1
+        self.root = self._insert(self.root, key, event)
+
+    def _insert(self, node, key, event):
+        if node is None:
+            return TreeNode(key, event)
+        if key < node.key:
+            node.left = self._insert(node.left, key, event)
+        elif node.key < key:
+            node.right = self._insert(node.right, key, event)
+        else:
+            node.events[event.name] = event
+            _update(node)
+            return node
+        return _rebalance(node)
+
+    def remove(self, name):
+        """حذف رویداد با نام داده‌شده؛ در صورت وجود True برمی‌گرداند"""
+        if name not in self._keys:
+            return False
+        key = self._keys.pop(name)
+        self.version += 1
+        self.root = self._remove(self.root, key, name)
+        return True
+
+    def _remove(self, node, key, name):
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self._remove(node.left, key, name)
+        elif node.key < key:
+            node.right = self._remove(node.right, key, name)
+        else:
+            node.events.pop(name, None)
+            if node.events:
+                _update(node)
+                return node
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.key, node.events = successor.key, successor.events
+            node.right = self._remove_min(node.right)
+        return _rebalance(node)
+
+    def _remove_min(self, node):
+        if node.left is None:
+            return node.right
+        node.left = self._remove_min(node.left)
+        return _rebalance(node)
+
+    def __iter__(self):
+        return self.range()
+
+    def range(self, low=None, high=None):
+        """
+        پیمایش تنبل رویدادهایی که کلیدشان بین low و high (شامل) است
+        سطل‌ها کپی نمی‌شوند، پس درخت نباید در میانه‌ی پیمایش تغییر کند.
+        """
+        stack = []
+        node = self.root
+        while node is not None:
+            if low is not None and node.key < low:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        while stack:
+            node = stack.pop()
+            if high is not None and high < node.key:
+                return
+            yield from node.events.values()
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def rank(self, key):
+        """تعداد رویدادهایی که کلیدشان از key کوچک‌تر است در زمان O(log n)"""
+        count = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                count += _size(node.left) + len(node.events)
+                node = node.right
+            else:
+                node = node.left
+        return count
+
+    def rank_of(self, name):
+        """
+        جایگاه (از صفر) رویداد با نام داده‌شده در ترتیب درخت، یا None
+        O(log n) تا سطل کلید و سپس جست‌وجوی خطی (در C) درون همان سطل
+        """
+        if name not in self._keys:
+            return None
+        key = self._keys[name]
+        node = self.root
+        count = 0
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                count += _size(node.left) + len(node.events)
+                node = node.right
+            else:
+                return _size(node.left) + count + indexOf(node.events, name)
+        return None
+
+    def iter_from(self, position):
+        """
+        پیمایش تنبل از جایگاه position (از صفر) به بعد در زمان O(log n + k)
+        اگر position وسط یک سطل بزرگ باشد، رد شدن از ابتدای سطل با islice (در C) انجام می‌شود.
+        """
+        stack = []  # (گره، شروع درون سطل)
+        node = self.root
+        while node is not None:
+            left = _size(node.left)
+            if position < left:
+                stack.append((node, 0))
+                node = node.left
+            elif position < left + len(node.events):
+                stack.append((node, position - left))
+                break
+            else:
+                position -= left + len(node.events)
+                node = node.right
+        while stack:
+            node, offset = stack.pop()
+            events = node.events.values()
+            yield from islice(events, offset, None) if offset else events
+            node = node.right
+            while node is not None:
+                stack.append((node, 0))
+                node = node.left
+
+    def page(self, offset, limit):
+        """یک صفحه از رویدادهای مرتب بدون ساختن کل لیست"""
+        return list(islice(self.iter_from(offset), limit))
+
+    def to_list(self):
+        """لیست مرتب همه‌ی رویدادها؛ تا تغییر بعدی درخت از کش خوانده می‌شود"""
+        cache = self._cache
+        if cache is None or cache[0] != self.version:
+            cache = self._cache = (self.version, list(self))
+        return list(cache[1])
+
+    def select(self, position):
+        """رویداد در جایگاه position (از صفر) یا None"""
+        return next(self.iter_from(position), None) if 0 <= position < _size(self.root) else None
+
+    def equal(self, key):
+        """بازگرداندن رویدادهایی که کلیدشان برابر key است"""
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return list(node.events.values())
+        return []
+
+
+_STATE_ORDER = {state: index for index, state in enumerate(VALID_STATES)}
 
 
 class EventTree:
+    VIEWS = ("date", "participants", "instructor", "status", "rating")
+
     def __init__(self):
-        """ایجاد یک درخت خالی برای دسته‌بندی رویدادها"""
-        self.root_by_date = None
-        self.root_by_participants = None
-        self.root_by_instructor = None
+        """ایجاد درخت‌های متوازن خالی برای دسته‌بندی رویدادها"""
+        self.by_date = BalancedIndex(key=lambda e: e.ordinal)
+        self.by_participants = BalancedIndex(key=lambda e: len(e.participants))
+        self.by_instructor = BalancedIndex(key=lambda e: e.instructor or "")
+        self.by_status = BalancedIndex(key=lambda e: _STATE_ORDER[e.state])
+        self.by_rating = BalancedIndex(key=lambda e: -(e.rating or 0))  # بالاترین امتیاز اول، بدون امتیاز آخر
+        self._views = {"date": self.by_date, "participants": self.by_participants,
+                       "instructor": self.by_instructor, "status": self.by_status, "rating": self.by_rating}
+
+    @property
+    def root_by_date(self):
+        return self.by_date.root
+
+    @property
+    def root_by_participants(self):
+        return self.by_participants.root
+
+    @property
+    def root_by_instructor(self):
+        return self.by_instructor.root
 
     def insert_by_date(self, event):
         """افزودن رویداد به درخت بر اساس تاریخ برگزاری"""
-        self.root_by_date = self._insert_recursive(self.root_by_date, event, key=lambda e: e.date)
+        self.by_date.insert(event)
 
     def insert_by_participants(self, event):
         """افزودن رویداد به درخت بر اساس تعداد شرکت‌کنندگان"""
-        self.root_by_participants = self._insert_recursive(self.root_by_participants, event, key=lambda e: len(e.participants))
+        self.by_participants.insert(event)
 
     def insert_by_instructor(self, event):
         """افزودن رویداد به درخت بر اساس نام مدرس"""
-        self.root_by_instructor = self._insert_recursive(self.root_by_instructor, event, key=lambda e: e.instructor)
+        self.by_instructor.insert(event)
 
-    def _insert_recursive(self, node, event, key):
-        """تابع بازگشتی برای افزودن گره به درخت"""
-        if node is None:
-            return TreeNode(event)
-        if key(event) < key(node.event):
-            node.left = self._insert_recursive(node.left, event, key)
-        elif key(event) > key(node.event):
-            node.right = self._insert_recursive(node.right, event, key)
-        return node
+    def insert_by_status(self, event):
+        """افزودن یا جابه‌جایی رویداد در درخت وضعیت (پس از تغییر وضعیت)"""
+        self.by_status.insert(event)
+
+    def insert_by_rating(self, event):
+        """افزودن یا جابه‌جایی رویداد در درخت امتیاز (پس از امتیازدهی)"""
+        self.by_rating.insert(event)
+
+    def bulk_load(self, events):
+        """ساخت همه‌ی درخت‌ها از لیست رویدادها به صورت یک‌جا"""
+        events = list(events)
+        for index in self._views.values():
+            index.bulk_load(events)
+
+    def insert(self, event):
+        """افزودن رویداد به همه‌ی درخت‌ها"""
+        for index in self._views.values():
+            index.insert(event)
+
+    def remove(self, event_name):
+        """حذف رویداد از همه‌ی درخت‌ها"""
+        removed = False
+        for index in self._views.values():
+            removed = index.remove(event_name) or removed
+        return removed
+
+    def view(self, name):
+        """درخت یک نمای مرتب (یکی از VIEWS)"""
+        if name not in self._views:
+            raise ValueError(f"unknown view '{name}'; expected one of {', '.join(self.VIEWS)}")
+        return self._views[name]
+
+    def page(self, name, offset=0, limit=50):
+        """یک صفحه از نمای مرتب در زمان O(log n + limit)"""
+        return self.view(name).page(offset, limit)
 
     def inorder_by_date(self):
-        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس تاریخ"""
-        events = []
-        self._inorder_recursive(self.root_by_date, events)
-        return events
+        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس تاریخ (کش‌شده تا تغییر بعدی)"""
+        return self.by_date.to_list()
 
     def inorder_by_participants(self):
-        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس تعداد شرکت‌کنندگان"""
-        events = []
-        self._inorder_recursive(self.root_by_participants, events)
-        return events
+        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس تعداد شرکت‌کنندگان (کش‌شده تا تغییر بعدی)"""
+        return self.by_participants.to_list()
 
     def inorder_by_instructor(self):
-        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس نام مدرس"""
-        events = []
-        self._inorder_recursive(self.root_by_instructor, events)
-        return events
-
-    def _inorder_recursive(self, node, events):
-        """تابع بازگشتی برای پیمایش درخت به صورت مرتب (in-order)"""
-        if node is not None:
-            self._inorder_recursive(node.left, events)
-            events.append(node.event)
-            self._inorder_recursive(node.right, events)
+        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس نام مدرس (کش‌شده تا تغییر بعدی)"""
+        return self.by_instructor.to_list()
+
+    def inorder_by_status(self):
+        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس وضعیت (کش‌شده تا تغییر بعدی)"""
+        return self.by_status.to_list()
+
+    def inorder_by_rating(self):
+        """بازگرداندن لیست مرتب‌شده رویدادها بر اساس امتیاز، بالاترین اول (کش‌شده تا تغییر بعدی)"""
+        return self.by_rating.to_list()
+
+    def events_between(self, start_date, end_date):
+        """پیمایش رویدادهای بین دو تاریخ (شامل) در زمان O(log n + k)"""
+        return self.by_date.range(to_ordinal(start_date), to_ordinal(end_date))
+
+    def events_on(self, date):
+        """رویدادهای یک تاریخ مشخص"""
+        return self.by_date.equal(to_ordinal(date))
+
+    def events_by_instructor(self, instructor):
+        """رویدادهای یک مدرس مشخص"""
+        return self.by_instructor.equal(instructor or "")
+
+    def events_with_participants(self, minimum=None, maximum=None):
+        """پیمایش رویدادهایی که تعداد شرکت‌کنندگانشان در بازه‌ی داده‌شده است"""
+        return self.by_participants.range(minimum, maximum)
 
     def __str__(self):
         """نمایش رویدادهای مرتب‌شده به صورت خوانا"""
-        events_by_date = self.inorder_by_date()
-        return "\n".join([f"{event.name} - {event.date}" for event in events_by_date])
+        return "\n".join([f"{event.name} - {event.date}" for event in self.by_date])